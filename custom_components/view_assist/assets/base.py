@@ -1,6 +1,8 @@
 """Base Asset Manager class."""
 
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -40,6 +42,16 @@ class BaseAssetManager:
     async def async_setup(self) -> None:
         """Set up the AssetManager."""
 
+    async def async_path_exists(self, *path: str | Path) -> bool:
+        """Return if a path exists without blocking the event loop."""
+        return await self.hass.async_add_executor_job(Path(*path).exists)
+
+    async def async_make_dirs(self, *path: str | Path) -> None:
+        """Create a directory and parents without blocking the event loop."""
+        await self.hass.async_add_executor_job(
+            partial(Path(*path).mkdir, parents=True, exist_ok=True)
+        )
+
     async def async_onboard(self, force: bool = False) -> dict[str, Any]:
         """Onboard the asset manager."""
         return {}
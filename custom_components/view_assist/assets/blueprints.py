@@ -63,7 +63,9 @@ class BlueprintManager(BaseAssetManager):
             blueprints = await self._get_blueprint_list()
             for name in blueprints:
                 try:
-                    if self.is_installed(name):
+                    if await self.hass.async_add_executor_job(
+                        self.is_installed, name
+                    ):
                         # blueprint already exists
                         installed_version = await self.async_get_installed_version(name)
                         latest_version = await self.async_get_latest_version(name)
@@ -121,7 +123,7 @@ class BlueprintManager(BaseAssetManager):
             "dinki",
             f"blueprint-{name.replace('_', '').lower()}.yaml",
         )
-        if path.exists():
+        if await self.async_path_exists(path):
             if data := await self.hass.async_add_executor_job(load_yaml_dict, path):
                 blueprint = models.Blueprint(data, schema=importer.BLUEPRINT_SCHEMA)
                 return self._read_blueprint_version(blueprint.metadata)
@@ -167,7 +169,7 @@ class BlueprintManager(BaseAssetManager):
     ) -> InstallStatus:
         """Install or update blueprint."""
         success = False
-        installed = self.is_installed(name)
+        installed = await self.hass.async_add_executor_job(self.is_installed, name)
 
         _LOGGER.debug("%s blueprint %s", "Updating" if installed else "Adding", name)
 
@@ -247,7 +249,7 @@ class BlueprintManager(BaseAssetManager):
             "dinki",
             bp_file,
         )
-        if bp_path.exists():
+        if await self.async_path_exists(bp_path):
             backup_path = Path(
                 self.hass.config.path(DOMAIN),
                 "blueprints",
@@ -227,7 +227,7 @@ class DashboardManager(BaseAssetManager):
             self.hass.config.path(DOMAIN),
             f"{DASHBOARD_DIR}/{DASHBOARD_DIR}.yaml",
         )
-        if not Path(dashboard_file_path).exists():
+        if not await self.async_path_exists(dashboard_file_path):
             # No dashboard file
             raise AssetManagerException(
                 f"Dashboard file not found: {dashboard_file_path}"
@@ -360,7 +360,9 @@ class DashboardManager(BaseAssetManager):
         # Ensure download to path exists
         base = self.hass.config.path(f"{DOMAIN}/{DASHBOARD_DIR}")
 
-        if cancel_if_exists and Path(base, f"{DASHBOARD_DIR}.yaml").exists():
+        if cancel_if_exists and await self.async_path_exists(
+            base, f"{DASHBOARD_DIR}.yaml"
+        ):
             return False
 
         # Validate view dir on repo
@@ -390,7 +392,7 @@ class DashboardManager(BaseAssetManager):
                     dashboard_only["views"] = [{"title": "Home"}]
 
                     file_path = Path(self.hass.config.config_dir, DOMAIN, DASHBOARD_DIR)
-                    file_path.mkdir(parents=True, exist_ok=True)
+                    await self.async_make_dirs(file_path)
 
                     if diffs := await self._compare_dashboard_to_master(dashboard_only):
                         await self.hass.async_add_executor_job(
@@ -410,7 +412,7 @@ class DashboardManager(BaseAssetManager):
         base = self.hass.config.path(DOMAIN)
         dashboard_file_path = f"{base}/{DASHBOARD_DIR}/{DASHBOARD_DIR}.yaml"
 
-        if not Path(dashboard_file_path).exists():
+        if not await self.async_path_exists(dashboard_file_path):
             # No master dashboard
             return None
 
@@ -430,7 +432,7 @@ class DashboardManager(BaseAssetManager):
         base = self.hass.config.path(DOMAIN)
         user_dashboard_file_path = f"{base}/{DASHBOARD_DIR}/user_dashboard.yaml"
 
-        if not Path(user_dashboard_file_path).exists():
+        if not await self.async_path_exists(user_dashboard_file_path):
             # No master dashboard
             return
 
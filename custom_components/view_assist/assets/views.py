@@ -148,7 +148,9 @@ class ViewManager(BaseAssetManager):
         # Download view if required
         downloaded = False
         # Don't download if file exists during onboarding
-        if self.onboarding and Path(file_path, f"{name}.yaml").exists():
+        if self.onboarding and await self.async_path_exists(
+            file_path, f"{name}.yaml"
+        ):
             _LOGGER.debug("View file already exists for %s.  Not downloading", name)
             downloaded = True
         elif download:
@@ -176,7 +178,7 @@ class ViewManager(BaseAssetManager):
             file_options = [f"user_{name}.yaml", f"{name}.yaml", f"{name}.saved.yaml"]
 
             for file_option in file_options:
-                if Path(file_path, file_option).exists():
+                if await self.async_path_exists(file_path, file_option):
                     file = Path(file_path, file_option)
                     break
 
@@ -274,7 +276,7 @@ class ViewManager(BaseAssetManager):
 
                     if view.get("cards", []):
                         # Ensure path exists
-                        file_path.mkdir(parents=True, exist_ok=True)
+                        await self.async_make_dirs(file_path)
                         return await self.hass.async_add_executor_job(
                             save_yaml,
                             Path(file_path, file_name),
@@ -374,13 +376,15 @@ class ViewManager(BaseAssetManager):
         else:
             dir_url = f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}/{view_name}"
 
-        if cancel_if_exists and Path(base, view_name, f"{view_name}.yaml").exists():
+        if cancel_if_exists and await self.async_path_exists(
+            base, view_name, f"{view_name}.yaml"
+        ):
             return False
 
         # Validate view dir on repo
         if await self.download_manager.async_dir_exists(dir_url):
             # Create view directory
-            Path(base, view_name).mkdir(parents=True, exist_ok=True)
+            await self.async_make_dirs(base, view_name)
 
             # Download view files
             success = await self.download_manager.async_download_dir(
@@ -388,7 +392,9 @@ class ViewManager(BaseAssetManager):
             )
 
             # Validate yaml file and install view
-            if success and Path(base, view_name, f"{view_name}.yaml").exists():
+            if success and await self.async_path_exists(
+                base, view_name, f"{view_name}.yaml"
+            ):
                 _LOGGER.debug("Downloaded %s", view_name)
                 return True
 
@@ -38,6 +38,7 @@ from .const import (
     CONF_BACKGROUND,
     CONF_BACKGROUND_MODE,
     CONF_BACKGROUND_SETTINGS,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_CYCLE_VIEWS,
     CONF_DASHBOARD,
     CONF_DEVELOPER_DEVICE,
@@ -82,7 +83,8 @@ from .const import (
     VACA_DOMAIN,
     VAIconSizes,
 )
-from .helpers import get_available_overlays, get_master_config_entry
+from .core.overlays import OverlayRegistry
+from .helpers import get_master_config_entry
 from .typed import (
     DISPLAY_DEVICE_TYPES,
     VAAssistPrompt,
@@ -222,9 +224,7 @@ async def get_dashboard_options_schema(
         AssetClass.DASHBOARD, "dashboard"
     )
     if AwesomeVersion(installed_dashboard) >= MIN_DASHBOARD_FOR_OVERLAYS:
-        available_overlays = await hass.async_add_executor_job(
-            get_available_overlays, hass
-        )
+        available_overlays = await OverlayRegistry.get(hass).async_get_overlays()
         overlay_options = [
             {"value": key, "label": value} for key, value in available_overlays.items()
         ]
@@ -386,6 +386,7 @@ INTEGRATION_OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ENABLE_UPDATES): BooleanSelector(),
         vol.Optional(CONF_TRANSLATION_ENGINE): ConversationAgentSelector(),
+        vol.Optional(CONF_COMPACT_ATTRIBUTES): BooleanSelector(),
     }
 )
 
@@ -675,6 +676,9 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
                 CONF_TRANSLATION_ENGINE: self.config_entry.options.get(
                     CONF_TRANSLATION_ENGINE
                 ),
+                CONF_COMPACT_ATTRIBUTES: self.config_entry.options.get(
+                    CONF_COMPACT_ATTRIBUTES
+                ),
             },
         )
 
@@ -122,6 +122,7 @@ CONF_MUSIC_MODE_AUTO = "music_mode_auto"
 CONF_MUSIC_MODE_TIMEOUT = "music_mode_timeout"
 
 CONF_ENABLE_UPDATES = "enable_updates"
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
 CONF_TRANSLATION_ENGINE = "translation_engine"
 CONF_DEVELOPER_DEVICE = "developer_device"
 CONF_DEVELOPER_MIMIC_DEVICE = "developer_mimic_device"
@@ -175,6 +176,7 @@ DEFAULT_VALUES = {
     CONF_MUSIC_MODE_TIMEOUT: 300,
     # Default integration options
     CONF_ENABLE_UPDATES: True,
+    CONF_COMPACT_ATTRIBUTES: False,
     # Default developer otions
     CONF_DEVELOPER_DEVICE: "",
     CONF_DEVELOPER_MIMIC_DEVICE: "",
@@ -195,6 +197,8 @@ ATTR_EXTRA = "extra"
 ATTR_TYPE = "type"
 
 ATTR_LANGUAGE = "language"
+ATTR_SENTENCES = "sentences"
+ATTR_TYPE_HINT = "type_hint"
 ATTR_TIMER_ID = "timer_id"
 ATTR_REMOVE_ALL = "remove_all"
 ATTR_INCLUDE_EXPIRED = "include_expired"
@@ -16,8 +16,10 @@ from homeassistant.core import HomeAssistant
 from ..assets import AssetsManager  # noqa: TID252
 from ..const import DOMAIN  # noqa: TID252
 from ..helpers import get_integration_entries  # noqa: TID252
+from ..relationships import RelationshipIndex  # noqa: TID252
 from ..typed import VAConfigEntry  # noqa: TID252
 from .alarm_repeater import AlarmRepeater
+from .blocking_io import BlockingIOAuditor
 from .http import HTTPManager
 from .javascript import JSModuleRegistration
 from .services import Services
@@ -29,6 +31,8 @@ from .websocket import WebsocketManager
 _LOGGER = logging.getLogger(__name__)
 
 LOAD_MODULES = [
+    BlockingIOAuditor,
+    RelationshipIndex,
     HTTPManager,
     JSModuleRegistration,
     TemplatesManager,
@@ -59,6 +63,11 @@ class CoreManager:
 
         setup_result = all(await asyncio.gather(*loader_tasks))
 
+        # Load sensor platform for optional diagnostic sensors
+        await self.hass.config_entries.async_forward_entry_setups(
+            self.config, [Platform.SENSOR]
+        )
+
         # Load update platform
         if self.config.runtime_data.integration.enable_updates:
             _LOGGER.debug("Loading %s platform", Platform.UPDATE)
@@ -95,6 +104,8 @@ class CoreManager:
             _LOGGER.debug("Unloading update notifications")
             await hass.config_entries.async_unload_platforms(config, [Platform.UPDATE])
 
+        await hass.config_entries.async_unload_platforms(config, [Platform.SENSOR])
+
         unloader_tasks = set()
         for module in LOAD_MODULES:
             if hasattr(module, "async_unload"):
@@ -0,0 +1,167 @@
+"""Blocking I/O audit for View Assist.
+
+When debug logging is enabled for the integration, a Python audit hook records
+filesystem and network calls made on the event loop thread from View Assist
+code, with their call stack.  Records are shown in the master config entry
+diagnostics.
+
+Audit hooks observe calls without replacing any functions, so this does not
+interfere with HA or other integrations wrapping the same calls.  They cannot
+be removed once added, so the hook is added once per process and does nothing
+while auditing is disabled.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+import os
+from pathlib import Path
+import sys
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..const import DOMAIN  # noqa: TID252
+from ..typed import VAConfigEntry  # noqa: TID252
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_DIR = str(Path(__file__).parent.parent)
+MAX_RECORDS = 100
+MAX_STACK_DEPTH = 10
+
+# Audit events to record and the index of their target arg
+AUDITED_EVENTS = {
+    "open": 0,
+    "os.listdir": 0,
+    "os.scandir": 0,
+    "os.mkdir": 0,
+    "os.rmdir": 0,
+    "os.remove": 0,
+    "os.rename": 0,
+    "os.chmod": 0,
+    "shutil.copyfile": 0,
+    "shutil.rmtree": 0,
+    "socket.getaddrinfo": 0,
+    "http.client.connect": 1,
+}
+
+_auditor: BlockingIOAuditor | None = None
+_hook_added = False
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    """Pass audited events to the enabled auditor."""
+    if event in AUDITED_EVENTS and _auditor is not None:
+        _auditor.audit(event, args)
+
+
+class BlockingIOAuditor:
+    """Class to record blocking I/O calls made on the event loop."""
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> BlockingIOAuditor | None:
+        """Get the blocking I/O auditor."""
+        try:
+            return hass.data[DOMAIN][cls.__name__]
+        except KeyError:
+            return None
+
+    def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.config = config
+        self.enabled = False
+        self.records: deque[dict[str, Any]] = deque(maxlen=MAX_RECORDS)
+        self.sites: dict[str, dict[str, Any]] = {}
+        self._recording = threading.local()
+
+    async def async_setup(self) -> bool:
+        """Enable auditing if debug logging is enabled."""
+        if logging.getLogger(__package__.rsplit(".", 1)[0]).isEnabledFor(
+            logging.DEBUG
+        ):
+            self.enable()
+        return True
+
+    async def async_unload(self) -> bool:
+        """Stop auditing."""
+        self.disable()
+        return True
+
+    def enable(self) -> None:
+        """Start recording audit events."""
+        global _auditor, _hook_added  # noqa: PLW0603
+
+        if self.enabled:
+            return
+        if not _hook_added:
+            sys.addaudithook(_audit_hook)
+            _hook_added = True
+        _auditor = self
+        self.enabled = True
+        _LOGGER.debug("Blocking I/O audit enabled")
+
+    def disable(self) -> None:
+        """Stop recording audit events."""
+        global _auditor  # noqa: PLW0603
+
+        if _auditor is self:
+            _auditor = None
+        self.enabled = False
+
+    def audit(self, event: str, args: tuple[Any, ...]) -> None:
+        """Record audit event if made on the event loop thread."""
+        if (
+            not self.enabled
+            or threading.get_ident() != self.hass.loop_thread_id
+            or getattr(self._recording, "active", False)
+        ):
+            return
+        target_arg = AUDITED_EVENTS[event]
+        self._record(
+            event,
+            args[target_arg] if len(args) > target_arg else None,
+            sys._getframe(2),  # noqa: SLF001
+        )
+
+    def _record(self, call: str, target: Any, frame: Any) -> None:
+        """Record call if made from View Assist code."""
+        self._recording.active = True
+        try:
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                filename = frame.f_code.co_filename
+                if filename.startswith(PACKAGE_DIR) and filename != __file__:
+                    stack.append(
+                        f"{filename.removeprefix(PACKAGE_DIR).lstrip(os.sep)}"
+                        f":{frame.f_lineno} {frame.f_code.co_name}"
+                    )
+                frame = frame.f_back
+
+            if not stack:
+                return
+
+            self.records.append(
+                {
+                    "time": dt_util.now().isoformat(),
+                    "call": call,
+                    "target": str(target),
+                    "stack": stack,
+                }
+            )
+            site = self.sites.setdefault(f"{call} {stack[0]}", {"count": 0})
+            site["count"] += 1
+        finally:
+            self._recording.active = False
+
+    def get_report(self) -> dict[str, Any]:
+        """Get report of recorded calls."""
+        return {
+            "enabled": self.enabled,
+            "sites": self.sites,
+            "recent": list(self.records),
+        }
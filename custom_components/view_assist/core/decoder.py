@@ -10,11 +10,10 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import wordtodigits
-
 from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN  # noqa: TID252
+from .translator.wordstonumbers import WordsToDigits
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -118,6 +117,37 @@ class LangPackKeys(StrEnum):
 
 REMOVE_CHARS = [",", ";", "!", "?", "'", '"']
 
+# Lookup tables built once from the enums, so sentences are decoded from a
+# single pass over their tokens rather than searching per enum option
+DURATION_ORDER = list(Durations)
+DURATION_INDEX = {duration: idx for idx, duration in enumerate(DURATION_ORDER)}
+DURATION_LOOKUP = {
+    **{f"{duration}s": duration for duration in Durations},
+    **{duration.value: duration for duration in Durations},
+}
+DAY_LOOKUP = {day.value: day for day in Days}
+MERIDIEM_LOOKUP = {meridiem.value: meridiem for meridiem in Meridiem}
+HOUR_PREFIX_LOOKUP = {prefix.value: prefix for prefix in HourPrefixes}
+SPECIAL_MINUTE_LOOKUP = {sm.value: sm for sm in SpecialMinutes}
+
+
+def _special_minute_adjustment(special_minute: SpecialMinutes) -> int:
+    """Get minutes adjustment of special minute when used as a time."""
+    name = special_minute.name
+    sign = 1
+    if name.endswith("PAST"):
+        name = name.removesuffix("PAST")
+    elif name.endswith("TO"):
+        name = name.removesuffix("TO")
+        sign = -1
+    value = SpecialMinuteConversion[name]
+    return sign * int(value) if value else 0
+
+
+SPECIAL_MINUTE_ADJUSTMENT = {
+    sm: _special_minute_adjustment(sm) for sm in SpecialMinutes
+}
+
 
 class SentenceDecoder:
     """Class to decode time and interval sentences."""
@@ -136,10 +166,6 @@ class SentenceDecoder:
         self.lang = lang
         self.translator: TimeSentenceTranslator | None = None
 
-        self.day: str | None = None
-        self.minutes_adjustment: int = 0
-        self.meridiem: str | None = None
-
     async def async_setup(self) -> bool:
         """Set up the Sentence Decoder."""
         if not self.translator:
@@ -155,9 +181,9 @@ class SentenceDecoder:
         if not self.translator:
             self.translator = TimeSentenceTranslator(self.hass, self.lang)
 
-        translated = self.translator.translate()
+        translated = self.translator.translate(sentence)
 
-        if self._is_interval(translated):
+        if self.classify(translated) == "interval":
             # Decode as interval
             t = TimerInterval(sentence=sentence, translated=translated)
             return self.decode_interval(t)
@@ -165,143 +191,133 @@ class SentenceDecoder:
         t = TimerTime(sentence=sentence, translated=translated)
         return self.decode_time(t)
 
+    @staticmethod
+    def classify(translated: str) -> str:
+        """Classify an english sentence as an interval or time.
+
+        This only checks for duration words, so is cheap enough to run ahead
+        of the normaliser.
+        """
+        if any(token in DURATION_LOOKUP for token in translated.split()):
+            return "interval"
+        return "time"
+
     def decode_interval(self, t: TimerInterval) -> TimerInterval:
         """Decode time intervals like '2 hours 30 minutes'."""
-
-        processed = " ".join(t.translated.split())
-        interval = {}
-        last_processed_duration = None
-
-        # Get interval parts from duration tags
-        remaining_sentence = processed
-        carry = ""
-        for duration in Durations:
-            if carry:
-                interval[duration] = carry
-                carry = ""
-
-            if m := self.get_match(remaining_sentence, duration):
-                parts = remaining_sentence.split(m)
-                if len(parts) == 2:
-                    # Handle if duration with no value. Assume 1
-                    if parts[0].strip() == "":
-                        parts[0] = "1"
-
-                    # Handle if special interval in duration
-                    part0 = parts[0].strip()
-                    if self._is_number(part0):
-                        interval[duration] = part0
-                    else:
-                        for sm in SpecialMinutes:
-                            if m := self.get_match(part0, sm):
-                                carry = self._convert_special_minute(
-                                    duration=duration, special_minute=sm
-                                )
-                                interval[duration] = part0.replace(m, "").strip()
-                                break
-                    remaining_sentence = parts[1].strip()
-                    last_processed_duration = duration
-
-        # if anything left in remaining sentence, see if it is special time and add to interval below last processed duration
-        # ie if last processed duration is hour, add to minutes
-        if remaining_sentence:
-            if m := self.get_match(remaining_sentence, list(SpecialMinutes)):
-                idx = list(Durations).index(last_processed_duration)
-                if idx + 1 < len(Durations):
-                    next_duration = list(Durations)[idx + 1]
-                    interval[next_duration] = self._convert_special_minute(
-                        next_duration, m
-                    )
+        interval: dict[Durations, str] = {}
+        pending: list[str] = []
+        last_duration: Durations | None = None
+
+        for token in t.translated.split():
+            if (duration := DURATION_LOOKUP.get(token)) is None:
+                pending.append(token)
+                continue
+
+            value = None
+            has_special_minute = False
+            for part in pending:
+                if self._is_number(part):
+                    value = part
+                elif sm := SPECIAL_MINUTE_LOOKUP.get(part):
+                    # Special minute in duration adds to the next duration
+                    # ie 1 and a half hours
+                    self._add_special_minute(interval, duration, sm)
+                    has_special_minute = True
+            # Handle if duration with no value. Assume 1
+            if value is None:
+                value = "0" if has_special_minute else "1"
+            interval[duration] = value
+            pending = []
+            last_duration = duration
+
+        # If anything left, see if it is special time and add to interval
+        # below last processed duration, ie 2 hours and a half
+        if last_duration:
+            for part in pending:
+                if sm := SPECIAL_MINUTE_LOOKUP.get(part):
+                    self._add_special_minute(interval, last_duration, sm)
+                    break
 
         # Set interval values on TimerInterval object
-        carry = 0
-        for key, value in interval.items():
+        for key in DURATION_ORDER:
+            if key not in interval:
+                continue
             try:
-                value = float(value)
+                value = float(interval[key])
             except ValueError:
                 value = 0
 
             if value != int(value):
                 # If decimal, add remainder to lower duration
-                idx = list(Durations).index(key)
-                if idx + 1 < len(Durations):
-                    lower_duration = list(Durations)[idx + 1]
+                idx = DURATION_INDEX[key]
+                if idx + 1 < len(DURATION_ORDER):
                     part = value - int(value)
                     setattr(
                         t,
-                        lower_duration,
+                        DURATION_ORDER[idx + 1],
                         int(part * 24) if key == Durations.DAY else int(part * 60),
                     )
             setattr(t, key, int(value) if value else 0)
         return t
 
+    def _add_special_minute(
+        self,
+        interval: dict[Durations, str],
+        duration: Durations,
+        special_minute: SpecialMinutes,
+    ) -> None:
+        """Add special minute of a duration to the next lower duration."""
+        idx = DURATION_INDEX[duration]
+        if idx + 1 < len(DURATION_ORDER):
+            if value := self._convert_special_minute(duration, special_minute):
+                interval[DURATION_ORDER[idx + 1]] = value
+
     def decode_time(self, t: TimerTime) -> TimerTime:
         """Decode specific time like '4:30 PM' or 'quarter past 3'."""
-
-        processed = t.translated.strip()
-
         adjustment = 0
+        special_minute: SpecialMinutes | None = None
+        hour_prefix: HourPrefixes | None = None
+        prefix_value: str | None = None
+        numbers: list[str] = []
+
+        for token in t.translated.split():
+            if not t.day and (day := DAY_LOOKUP.get(token)):
+                t.day = day
+            elif not special_minute and (sm := SPECIAL_MINUTE_LOOKUP.get(token)):
+                special_minute = sm
+                adjustment = SPECIAL_MINUTE_ADJUSTMENT[sm]
+            elif not t.meridiem and (mer := MERIDIEM_LOOKUP.get(token)):
+                t.meridiem = mer
+            elif (
+                not t.meridiem
+                and MERIDIEM_LOOKUP.get(token[-2:])
+                and token[:-2].replace(":", "", 1).isdigit()
+            ):
+                # ie 4pm or 4:30pm
+                t.meridiem = MERIDIEM_LOOKUP[token[-2:]]
+                numbers.append(token[:-2])
+            elif prefix := HOUR_PREFIX_LOOKUP.get(token):
+                # Convert phrases like "20 past 4" to "4:20"
+                hour_prefix = prefix
+                prefix_value = numbers[-1] if numbers else None
+                numbers = []
+            elif self._is_number(token) or ":" in token:
+                numbers.append(token)
+
+        if hour_prefix:
+            if self._is_number(prefix_value):
+                adjustment = int(float(prefix_value))
+            else:
+                # Adjustment may already have been set by special minutes
+                adjustment = abs(adjustment)
+            if hour_prefix == HourPrefixes.TO:
+                adjustment = -adjustment
 
-        # Extract day if mentioned
-        for day in Days:
-            if m := self.get_match(processed, day):
-                t.day = m
-                processed = processed.replace(m, "").strip()
-                break
-
-        # Convert word intervals to time adjustments
-        for sm in SpecialMinutes:
-            if m := self.get_match(processed, sm):
-                processed = processed.replace(m, "").strip()
-                convert_to = SpecialMinuteConversion[sm.upper()]
-                adjustment = int(convert_to) if self._is_number(convert_to) else 0
-                break
-
-        # Extract meridiem if mentioned
-        for mer in Meridiem:
-            if m := self.get_match(processed, mer, whole_word=False):
-                t.meridiem = m
-                processed = processed.replace(m, "").strip()
-                break
-
-        # Convert phrases like "20 past 4" to "4:20"
-        for addition in HourPrefixes:
-            if m := self.get_match(processed, addition):
-                parts = processed.split(m)
-                if len(parts) == 2:
-                    first_part = parts[0].strip()
-                    if self._is_number(first_part):
-                        adjustment = (
-                            int(first_part)
-                            if addition == HourPrefixes.PAST
-                            else -int(first_part)
-                        )
-                    # Adjustment may already have been set by special minutes
-                    elif adjustment > 0:
-                        if m == HourPrefixes.TO:
-                            adjustment = -adjustment
-
-                    processed = parts[1].strip()
-
-        # Special handling for "half [hour]" with no duration marker
-        parts = processed.split(" ")
-        if (
-            len(parts) == 2
-            and parts[0] == SpecialMinuteConversion.HALF
-            and self._is_number(parts[1])
-        ):
-            adjustment = 30
-            processed = parts[1].strip()
-
-        # Ensure correct spacing
-        processed = " ".join(processed.split())
+        processed = numbers[0] if len(numbers) == 1 else ":".join(numbers[:2])
 
         # Convert number to time ie 1600 to 16:00
         if self._is_number(processed) and len(processed) in [3, 4]:
-            if len(processed) == 3:
-                processed = f"{processed[0]}:{processed[1:]}"
-            else:
-                processed = f"{processed[:2]}:{processed[2:]}"
+            processed = f"{processed[:-2]}:{processed[-2:]}"
 
         # If just hour with no minutes, add :00
         if self._is_number(processed) and len(processed) in [1, 2]:
@@ -325,10 +341,6 @@ class SentenceDecoder:
 
         return t
 
-    def _is_interval(self, s: str) -> bool:
-        durations = Durations
-        return any(self.get_match(s, duration) for duration in durations)
-
     def _is_number(self, s: str | None = None) -> bool:
         """Check if string is a number. Including decimals."""
         if s is None or s == "":
@@ -337,22 +349,6 @@ class SentenceDecoder:
         allowed_chars = "0123456789."
         return all(char in allowed_chars for char in s)
 
-    def get_match(
-        self, s: str, options: str | list[str], whole_word: bool = True
-    ) -> str | None:
-        """Get first matching option in string."""
-        if isinstance(options, str):
-            options = [options]
-
-        s = f" {s.strip()} "
-
-        for option in options:
-            if whole_word and f" {option} " in s:
-                return option
-            if not whole_word and option in s:
-                return option
-        return None
-
     def _convert_special_minute(
         self, duration: Durations, special_minute: SpecialMinutes
     ) -> str | None:
@@ -372,21 +368,35 @@ class SentenceDecoder:
 class TimeSentenceTranslator:
     """Translate time sentences to english."""
 
+    # Order of pack collections.  Earlier collections win on the same phrase
+    # ie so three quarters is not translated to 3 quarters
+    COLLECTIONS = [
+        LangPackKeys.SPECIAL_MINUTES,
+        LangPackKeys.MERIDIEM,
+        LangPackKeys.DAYS,
+        LangPackKeys.NUMBERS,
+        LangPackKeys.DURATIONS,
+        LangPackKeys.HOUR_PREFIXES,
+    ]
+
     def __init__(self, hass: HomeAssistant, locale: str = "en") -> None:
         """Initialise."""
         self.hass = hass
         self.locale = locale
         self.lang: dict[str, Any] = {}
 
+        self.phrases: dict[tuple[str, ...], str] = {}
+        self.max_phrase_length = 1
+        self.remove_words: frozenset[str] = frozenset()
+
     def load_language_pack(self, lang: str) -> None:
-        """Load language pack."""
-        # Get current path of this file
+        """Load language pack and build its lookup tables."""
         p = Path(
             self.hass.config.path(DOMAIN), "translations", "timers", f"{lang}.json"
         )
 
         if not p.exists():
-            p = Path(Path(__file__).parent, "translations", "timers", "en.json")
+            p = Path(Path(__file__).parent.parent, "translations", "timers", "en.json")
         try:
             with p.open(mode="r", encoding="utf-8") as f:
                 self.lang = json.load(f)
@@ -395,20 +405,23 @@ class TimeSentenceTranslator:
         except OSError:
             _LOGGER.error("Error loading language file %s", p)
 
-    def get_match(self, s: str, options: str | list[str]) -> str | None:
-        """Get first matching option in string."""
-        if isinstance(options, str):
-            options = [options]
-
-        s = f" {s.strip()} "
-
-        for option in options:
-            if f" {option} " in s:
-                return option
-        return None
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        """Build phrase lookup from language pack collections."""
+        self.phrases = {}
+        for collection in self.COLLECTIONS:
+            for replacement, variants in self.lang.get(collection, {}).items():
+                if isinstance(variants, str):
+                    variants = [variants]
+                for variant in variants:
+                    if phrase := tuple(str(variant).lower().split()):
+                        self.phrases.setdefault(phrase, str(replacement))
+        self.max_phrase_length = max((len(p) for p in self.phrases), default=1)
+        self.remove_words = frozenset(self.lang.get(LangPackKeys.REMOVE_WORDS, []))
 
     def clean_sentence(self, s: str) -> str:
-        """Clean sentence by removing unwanted characters and words."""
+        """Clean sentence by removing unwanted characters."""
         s = f" {s.strip()} "
 
         # Replace decimal separator with .
@@ -424,77 +437,35 @@ class TimeSentenceTranslator:
         for char in REMOVE_CHARS:
             s = s.replace(char, "")
 
-        # Remove unwanted words
-        if rw := self.lang.get(LangPackKeys.REMOVE_WORDS):
-            for word in rw:
-                s = s.replace(f" {word} ", " ")
-
-        # Ensure 1 space between words
-        return " ".join(s.split())
-
-    def _order_lang_key_entries(self, lang_key: str) -> dict[str, Any]:
-        """Order entries in lang_key by length of entry, longest first."""
-        if lang_key not in self.lang:
-            return {}
-
-        sorted_keys = sorted(self.lang.get(lang_key), key=len, reverse=True)
-        return dict(
-            zip(
-                sorted_keys,
-                [self.lang.get(lang_key)[key] for key in sorted_keys],
-                strict=False,
-            )
-        )
+        return s
 
     def translate(self, sentence: str) -> str:
-        """Load translation file and translate sentence."""
+        """Translate sentence with a single pass over its tokens."""
         if not self.lang:
             self.load_language_pack(self.locale)
 
-        # Make sentence lowercase for matching
-        s = sentence.lower()
-
-        # Preprocess sentence to remove and replace words/text/symbols
-        s = self.clean_sentence(s)
-
-        # Handle special cases like "quarter", "half", "oclock"
-        # Important this is first to stop three quarters being translated to 3 quarters
-        if sm := self._order_lang_key_entries(LangPackKeys.SPECIAL_MINUTES):
-            for sm, words in sm.items():
-                if m := self.get_match(s, words):
-                    s = s.replace(m, sm)
-
-        # Replace variants with standard am/pm
-        if mr := self._order_lang_key_entries(LangPackKeys.MERIDIEM):
-            for mr, variants in mr.items():
-                if m := self.get_match(s, variants):
-                    s = s.replace(m, mr)
-
-        # Replace days of the week
-        if dow := self._order_lang_key_entries(LangPackKeys.DAYS):
-            for day, variants in dow.items():
-                if m := self.get_match(s, variants):
-                    s = s.replace(m, day)  # Remove day from time string
-
-        # Replace language numbers with digits
-        if num := self._order_lang_key_entries(LangPackKeys.NUMBERS):
-            for digit, variants in num.items():
-                if m := self.get_match(s, variants):
-                    s = s.replace(m, str(digit))
-
-        # Replace duration words with standard duration
-        if dur := self._order_lang_key_entries(LangPackKeys.DURATIONS):
-            for duration, variants in dur.items():
-                if m := self.get_match(s, variants):
-                    s = s.replace(m, duration)
-
-        # Replace any special additions like "past" or "to"
-        if hour_prefixes := self._order_lang_key_entries(LangPackKeys.HOUR_PREFIXES):
-            for addition, variants in hour_prefixes.items():
-                if m := self.get_match(s, variants):
-                    s = s.replace(m, addition)
+        tokens = self.clean_sentence(sentence.lower()).split()
+        output: list[str] = []
+
+        idx = 0
+        while idx < len(tokens):
+            if tokens[idx] in self.remove_words:
+                idx += 1
+                continue
+
+            # Longest phrase match at this token
+            for length in range(
+                min(self.max_phrase_length, len(tokens) - idx), 0, -1
+            ):
+                if (
+                    replacement := self.phrases.get(tuple(tokens[idx : idx + length]))
+                ) is not None:
+                    output.append(replacement)
+                    idx += length
+                    break
+            else:
+                output.append(tokens[idx])
+                idx += 1
 
         # Finally convert any text words to digits
-        if any(n for n in self.lang[LangPackKeys.NUMBERS] if n in s):
-            s = wordtodigits.convert(s)
-        return " ".join(s.split())
+        return WordsToDigits.convert(" ".join(output))
@@ -43,15 +43,17 @@ class HTTPManager:
             # Runtime error - likley this is already registered.
             _LOGGER.debug("Resource path already registered")
 
+    @staticmethod
+    def _create_dirs(va_dir: str) -> None:
+        """Create config/view_assist path and standard sub dirs.  Runs in executor."""
+        Path(va_dir).mkdir(exist_ok=True)
+        for sub_dir in VA_SUB_DIRS:
+            Path(va_dir, sub_dir).mkdir(exist_ok=True)
+
     async def create_url_paths(self):
         """Create viewassist url paths."""
 
-        # Create config/view_assist path if it doesn't exist
         va_dir = self.hass.config.path(DOMAIN)
-        Path(va_dir).mkdir(exist_ok=True)
-
-        # Create out list of standard sub dirs
-        for sub_dir in VA_SUB_DIRS:
-            Path(va_dir, sub_dir).mkdir(exist_ok=True)
+        await self.hass.async_add_executor_job(self._create_dirs, va_dir)
 
         await self._async_register_path(f"/{URL_BASE}", va_dir)
@@ -0,0 +1,92 @@
+"""Overlay registry for View Assist.
+
+Overlays are defined as top level divs with an id and data-name in the
+dashboard and custom overlay html files.  Files are parsed in the executor and
+the result cached by file mtime and size, so they are only re-parsed if changed.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from homeassistant.core import HomeAssistant
+
+from ..const import DASHBOARD_DIR, DOMAIN, OVERLAY_FILE_NAME  # noqa: TID252
+
+_LOGGER = logging.getLogger(__name__)
+
+CUSTOM_OVERLAYS_DIR = "custom_overlays"
+
+
+class OverlayRegistry:
+    """Class to discover and cache available overlays."""
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> OverlayRegistry:
+        """Get the overlay registry instance."""
+        data = hass.data.setdefault(DOMAIN, {})
+        if cls.__name__ not in data:
+            data[cls.__name__] = cls(hass)
+        return data[cls.__name__]
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise."""
+        self.hass = hass
+        # path -> ((mtime_ns, size), overlays)
+        self._files: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+        self.overlays: dict[str, str] = {}
+
+    @property
+    def paths(self) -> list[str]:
+        """Get overlay file paths in order of precedence."""
+        return [
+            self.hass.config.path(DOMAIN, DASHBOARD_DIR, f"{OVERLAY_FILE_NAME}.html"),
+            self.hass.config.path(
+                DOMAIN, CUSTOM_OVERLAYS_DIR, f"{OVERLAY_FILE_NAME}.html"
+            ),
+        ]
+
+    async def async_get_overlays(self) -> dict[str, str]:
+        """Get available overlays, re-parsing any changed files."""
+        return await self.hass.async_add_executor_job(self.load)
+
+    def load(self) -> dict[str, str]:
+        """Load available overlays.  Runs in executor."""
+        overlays = {}
+        for path in self.paths:
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                self._files.pop(path, None)
+                continue
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._files.get(path)
+            if cached is None or cached[0] != signature:
+                _LOGGER.debug("Parsing overlays from %s", path)
+                cached = self._files[path] = (signature, self.parse(path))
+            overlays.update(cached[1])
+
+        self.overlays = overlays
+        return overlays
+
+    @staticmethod
+    def parse(path: str) -> dict[str, str]:
+        """Parse overlay ids and names from an html file."""
+        try:
+            content = Path(path).read_text(encoding="utf-8")
+        except OSError as ex:
+            _LOGGER.warning("Unable to read overlay file %s - %s", path, ex)
+            return {}
+
+        overlays = {}
+        soup = BeautifulSoup(content, "html.parser")
+        for div in soup.find_all("div", recursive=False):
+            o_id = div.get("id")
+            name = div.get("data-name")
+            if o_id and name:
+                overlays[o_id] = name
+        return overlays
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 import logging
 from typing import Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template, TemplateEnvironment
 
 from ..helpers import (  # noqa: TID252
@@ -16,6 +23,8 @@ from ..helpers import (  # noqa: TID252
     get_mimic_entity_id,
     get_sensor_entity_from_instance,
 )
+from ..const import DOMAIN  # noqa: TID252
+from ..relationships import RelationshipIndex, Relationships  # noqa: TID252
 from ..typed import VAConfigEntry  # noqa: TID252
 
 DEFAULT_UNAVAILABLE_STATES = [
@@ -25,16 +34,28 @@ DEFAULT_UNAVAILABLE_STATES = [
     None,
 ]
 
+# Max number of memoised filter results
+MAX_CACHED_RESULTS = 64
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class TemplatesManager:
     """Class to manage template related functionality."""
 
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> TemplatesManager | None:
+        """Get the templates manager."""
+        try:
+            return hass.data[DOMAIN][cls.__name__]
+        except KeyError:
+            return None
+
     def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
         """Initialize the TemplatesManager."""
         self.hass = hass
         self.config = config
+        self.attribute_index = EntityAttributeIndex(hass)
 
     async def async_setup(self) -> bool:
         """Set up the TemplatesManager."""
@@ -81,8 +102,152 @@ class TemplatesManager:
 
     async def async_unload(self) -> bool:
         """Unload the TemplatesManager."""
+        self.attribute_index.async_unload()
+        return True
+
+
+class EntityAttributeIndex:
+    """Index of VA entity attribute values for attribute filters.
+
+    Attribute values are indexed from VA entity state changes and filter
+    results are memoised until an attribute they use changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise."""
+        self.hass = hass
+        self._relationships: Relationships | None = None
+        self._entities: list[str] = []
+        self._attributes: dict[str, Mapping[str, Any]] = {}
+        self._values: dict[str, dict[Any, set[str]]] = {}
+        self._results: dict[str, tuple[set[str], list[str]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop listening for state changes and clear the index."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._relationships = None
+        self._attributes = {}
+        self._values = {}
+        self._results = {}
+
+    def _ensure_index(self) -> bool:
+        """Build the index if VA entities have changed."""
+        if not (index := RelationshipIndex.get(self.hass)):
+            return False
+
+        relationships = index.relationships
+        if relationships is self._relationships:
+            return True
+
+        self.async_unload()
+        self._relationships = relationships
+        self._entities = relationships.device_entities
+        for entity_id in self._entities:
+            if state := self.hass.states.get(entity_id):
+                self._attributes[entity_id] = state.attributes
+                self._index_values(entity_id, state.attributes, {})
+        self._unsub = async_track_state_change_event(
+            self.hass, self._entities, self._async_on_state_change
+        )
         return True
 
+    def _index_values(
+        self,
+        entity_id: str,
+        attributes: Mapping[str, Any],
+        old_attributes: Mapping[str, Any],
+    ) -> set[str]:
+        """Update indexed values of an entity.  Returns changed attributes."""
+        changed = set()
+        for attr in attributes.keys() | old_attributes.keys():
+            old_value = old_attributes.get(attr)
+            value = attributes.get(attr)
+            if attr in old_attributes and attr in attributes and old_value == value:
+                continue
+            changed.add(attr)
+            try:
+                self._values[attr][old_value].discard(entity_id)
+            except (KeyError, TypeError):
+                pass
+            try:
+                if value is not None:
+                    self._values.setdefault(attr, {}).setdefault(value, set()).add(
+                        entity_id
+                    )
+            except TypeError:
+                # Unhashable values are matched by scanning attributes
+                pass
+        return changed
+
+    @callback
+    def _async_on_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Update index from VA entity state change."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        old_attributes = self._attributes.pop(entity_id, None)
+        attributes = new_state.attributes if new_state else {}
+        if new_state:
+            self._attributes[entity_id] = attributes
+
+        changed = self._index_values(entity_id, attributes, old_attributes or {})
+        if old_attributes is None or new_state is None:
+            # Entity gained or lost its state so any filter result can change
+            self._results = {}
+        elif changed:
+            self._results = {
+                key: result
+                for key, result in self._results.items()
+                if not result[0] & changed
+            }
+
+    def _match(self, filter: dict[str, Any]) -> set[str]:
+        """Get entities with any attribute matching the filter."""
+        matched = set()
+        for attr, value in filter.items():
+            try:
+                if value is not None:
+                    matched |= self._values.get(attr, {}).get(value, set())
+                    continue
+            except TypeError:
+                pass
+            matched.update(
+                entity_id
+                for entity_id, attributes in self._attributes.items()
+                if attributes.get(attr) == value
+            )
+        return matched
+
+    def get_entities(
+        self,
+        filter: dict[str, Any] | None = None,
+        exclude: dict[str, Any] | None = None,
+    ) -> list[str] | None:
+        """Get VA entity ids by attribute filter.  Returns None if not indexed."""
+        if not self._ensure_index():
+            return None
+
+        if not filter and not exclude:
+            return list(self._entities)
+        if not filter:
+            return []
+
+        key = repr((sorted(filter.items()), sorted((exclude or {}).items())))
+        if (result := self._results.get(key)) is None:
+            matched = self._match(filter)
+            if exclude:
+                matched -= self._match(exclude)
+            if len(self._results) >= MAX_CACHED_RESULTS:
+                self._results = {}
+            result = self._results[key] = (
+                set(filter) | set(exclude or {}),
+                [entity_id for entity_id in self._entities if entity_id in matched],
+            )
+        return list(result[1])
+
 
 # Template functions
 class ViewAssistEntities:
@@ -99,7 +264,11 @@ class ViewAssistEntities:
         attr: str | None = None,
     ) -> list[str]:
         "Call."
-        entities = get_entities_by_attr_filter(self._hass, filter, exclude)
+        entities = None
+        if manager := TemplatesManager.get(self._hass):
+            entities = manager.attribute_index.get_entities(filter, exclude)
+        if entities is None:
+            entities = get_entities_by_attr_filter(self._hass, filter, exclude)
         if attr:
             return [
                 self._hass.states.get(entity).attributes.get(attr)
@@ -122,7 +291,10 @@ class ViewAssistEntity:
     def __call__(self, param: str, mimic: bool = True) -> list[str]:
         "Call."
         if param is not None:
-            if entry := get_config_entry_by_config_data_value(self._hass, param):
+            if index := RelationshipIndex.get(self._hass):
+                if entry_id := index.get_entry_for_config_value(param):
+                    return index.get_sensor_for_entry(entry_id)
+            elif entry := get_config_entry_by_config_data_value(self._hass, param):
                 return get_sensor_entity_from_instance(self._hass, entry.entry_id)
         if mimic:
             return get_mimic_entity_id(self._hass)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 import contextlib
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 import datetime as dt
 from enum import StrEnum
 import inspect
@@ -46,8 +46,10 @@ from ..const import (  # noqa: TID252
     ATTR_INCLUDE_EXPIRED,
     ATTR_LANGUAGE,
     ATTR_REMOVE_ALL,
+    ATTR_SENTENCES,
     ATTR_TIMER_ID,
     ATTR_TYPE,
+    ATTR_TYPE_HINT,
     DOMAIN,
 )
 from ..helpers import (  # noqa: TID252
@@ -57,7 +59,7 @@ from ..helpers import (  # noqa: TID252
     get_mimic_entity_id,
 )
 from ..typed import VAEvent, VAEventType  # noqa: TID252
-from .translator import Normaliser, TimerInfo, Translator
+from .translator import TimerInfo, Translator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -124,6 +126,21 @@ class Timer:
     extra_info: dict[str, Any] | None = None
 
 
+@dataclass
+class DecodedTime:
+    """Class to hold a decoded time sentence."""
+
+    sentence: str
+    translated: str | None = None
+    timer_info: TimerInfo | None = None
+    expiry: dt.datetime | None = None
+
+
+def clean_time_sentence(sentence: str) -> str:
+    """Remove chars some STT add to time sentences (ie - or .)."""
+    return sentence.replace("-", "").replace(".", "")
+
+
 def get_formatted_time(timer_dt: dt.datetime, h24format: bool = False) -> str:
     """Format datetime to time."""
 
@@ -678,6 +695,34 @@ class TimerManager:
             seconds=timerinfo.seconds,
         )
 
+    async def decode_time_sentences(
+        self,
+        sentences: list[str],
+        language: str = "en",
+        time_type: str | None = None,
+    ) -> list[DecodedTime]:
+        """Decode time sentences to TimerInfo and expiry without setting timers."""
+        translator = Translator.get(self.hass)
+        decoded = await translator.decode_times(
+            [clean_time_sentence(sentence) for sentence in sentences],
+            locale=language,
+            type_hint=time_type,
+        )
+        return [
+            DecodedTime(
+                sentence=sentence,
+                translated=translated,
+                timer_info=timer_info,
+                # Expiry calc can modify timer info, so use a copy
+                expiry=self.get_expiry_from_timerinfo(replace(timer_info))
+                if timer_info
+                else None,
+            )
+            for sentence, (translated, timer_info) in zip(
+                sentences, decoded, strict=True
+            )
+        ]
+
     async def _fire_event(self, timer_id: int, event_type: TimerEvent):
         """Fire timer event on the event bus."""
         if timer := self.store.timers.get(timer_id):
@@ -990,6 +1035,14 @@ class TimerManagerServices:
         }
     )
 
+    DECODE_TIME_SERVICE_SCHEMA = vol.Schema(
+        {
+            vol.Required(ATTR_SENTENCES): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_LANGUAGE, default="en"): str,
+            vol.Optional(ATTR_TYPE_HINT): vol.In(["time", "interval"]),
+        }
+    )
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the menu manager services."""
         self.hass = hass
@@ -1029,9 +1082,23 @@ class TimerManagerServices:
             supports_response=SupportsResponse.ONLY,
         )
 
+        self.hass.services.async_register(
+            DOMAIN,
+            "decode_time",
+            self._async_handle_decode_time,
+            schema=self.DECODE_TIME_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
     def unregister(self):
         """Unregister menu manager services."""
-        for service in ["set_timer", "snooze_timer", "cancel_timer", "get_timers"]:
+        for service in [
+            "set_timer",
+            "snooze_timer",
+            "cancel_timer",
+            "get_timers",
+            "decode_time",
+        ]:
             self.hass.services.async_remove(DOMAIN, service)
 
     async def decode_time_sentence(
@@ -1039,9 +1106,9 @@ class TimerManagerServices:
     ) -> tuple[None, None]:
         """Decode a time sentence into TimerTime or TimerInterval object."""
         translator = Translator.get(self.hass)
-        normaliser = Normaliser(self.hass, locale=language)
-        en = await translator.translate_time(sentence, language)
-        n = await normaliser.normalise(en, type_hint=time_type)
+        en, n = await translator.decode_time(
+            sentence, locale=language, type_hint=time_type
+        )
 
         if n:
             _LOGGER.debug(
@@ -1090,7 +1157,7 @@ class TimerManagerServices:
             
         # Some STT add additional chars.  This removes those that add - or .
         if timer_time:
-            timer_time = timer_time.replace("-", "").replace(".", "")
+            timer_time = clean_time_sentence(timer_time)
         
         sentence, timer_info = await self.decode_time_sentence(
             timer_time, language=language, time_type=time_type
@@ -1208,3 +1275,23 @@ class TimerManagerServices:
             include_expired=include_expired,
         )
         return {"result": result}
+
+    async def _async_handle_decode_time(self, call: ServiceCall) -> ServiceResponse:
+        """Handle a decode time service call."""
+        tm = TimerManager.get(self.hass)
+        decoded = await tm.decode_time_sentences(
+            call.data[ATTR_SENTENCES],
+            language=call.data.get(ATTR_LANGUAGE, "en"),
+            time_type=call.data.get(ATTR_TYPE_HINT),
+        )
+        return {
+            "result": [
+                {
+                    "sentence": d.sentence,
+                    "translated": d.translated,
+                    "timer_info": asdict(d.timer_info) if d.timer_info else None,
+                    "expiry": d.expiry.isoformat() if d.expiry else None,
+                }
+                for d in decoded
+            ]
+        }
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import time
 from typing import Any
 
-from homeassistant.components import conversation
+from homeassistant.components import assist_pipeline, conversation
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from ...const import DOMAIN  # noqa: TID252
 from ...typed import VAConfigEntry  # noqa: TID252
+from .fastpath import FastPathRecognizer
+from .langpack import NORMALISER_PACK, LanguagePacks
 from .normaliser import Normaliser, TimerInfo
 from .translator import ConversationAgentTranslator, TimeSentenceTranslator
 
@@ -18,10 +25,59 @@ __all__ = [
     "Normaliser",
     "TimeSentenceTranslator",
     "TimerInfo",
+    "TranslationTier",
 ]
 
+_LOGGER = logging.getLogger(__name__)
+
+TRANSLATOR_STORE_NAME = f"{DOMAIN}.translator"
+# Number of recently used locales to remember for warm up
+RECENT_LOCALES_MAX = 5
+
+
+class TranslationTier(StrEnum):
+    """Translation tiers."""
+
+    LOCAL = "local"
+    AGENT = "agent"
+
+
+@dataclass
+class TierStats:
+    """Hit rate and latency stats for a translation tier."""
+
+    attempts: int = 0
+    hits: int = 0
+    total_ms: float = 0
+    last_ms: float = 0
+
+    def record(self, hit: bool, elapsed_ms: float) -> None:
+        """Record a decode attempt."""
+        self.attempts += 1
+        if hit:
+            self.hits += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return stats as dict."""
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "misses": self.attempts - self.hits,
+            "hit_rate": round(self.hits / self.attempts, 3) if self.attempts else 0,
+            "avg_ms": round(self.total_ms / self.attempts, 2) if self.attempts else 0,
+            "last_ms": round(self.last_ms, 2),
+        }
+
 
 class Translator:
+    """Tiered translator.
+
+    The local language pack is always tried first and the conversation agent,
+    if one is configured, is only used if the local path cannot decode.
+    """
+
     @classmethod
     def get(cls, hass: HomeAssistant) -> Translator | None:
         """Get the websocket manager for a config entry."""
@@ -34,24 +90,97 @@ class Translator:
         """Initialise the translator."""
         self.hass = hass
         self.config = config
-        self.translator = None
+        self.translator: TimeSentenceTranslator | None = None
+        self.agent_translator: ConversationAgentTranslator | None = None
+        self.stats: dict[str, TierStats] = {}
+        self.fast_paths: dict[str, FastPathRecognizer] = {}
+        self.fast_path_stats: dict[str, TierStats] = {}
+        self.store = Store(hass, 1, TRANSLATOR_STORE_NAME)
+        self.recent_locales: list[str] = []
 
     async def async_setup(self) -> bool:
         """Set up the Translator."""
         engine = self.config.runtime_data.integration.translation_engine
 
-        if engine is None or engine == conversation.HOME_ASSISTANT_AGENT:
-            self.translator = TimeSentenceTranslator(self.hass, self.config)
-        else:
-            self.translator = ConversationAgentTranslator(self.hass, self.config)
+        if stored := await self.store.async_load():
+            self.recent_locales = stored.get("recent_locales", [])
+
+        self.translator = TimeSentenceTranslator(self.hass, self.config)
+        self.stats[TranslationTier.LOCAL] = TierStats()
+
+        if engine is not None and engine != conversation.HOME_ASSISTANT_AGENT:
+            self.agent_translator = ConversationAgentTranslator(self.hass, self.config)
+            self.stats[TranslationTier.AGENT] = TierStats()
+            await self.agent_translator.async_setup()
+
+        # Preload language packs in use so the first request is not slower
+        self.config.async_create_background_task(
+            self.hass, self.async_warm_up(), name="VA translator warm up"
+        )
 
         return True
 
+    def _get_locales_in_use(self) -> list[str]:
+        """Get HA, assist pipeline and recently used locales."""
+        locales = [self.hass.config.language]
+        try:
+            locales.extend(
+                pipeline.language
+                for pipeline in assist_pipeline.async_get_pipelines(self.hass)
+            )
+        except KeyError:
+            # Assist pipeline not loaded
+            pass
+        locales.extend(self.recent_locales)
+
+        packs = LanguagePacks.get(self.hass)
+        return list(dict.fromkeys(packs.pack_name(locale) for locale in locales if locale))
+
+    async def async_warm_up(self) -> None:
+        """Load and compile language packs for locales in use."""
+        packs = LanguagePacks.get(self.hass)
+        start = time.perf_counter()
+        await packs.async_get(NORMALISER_PACK)
+        locales = self._get_locales_in_use()
+        for locale in locales:
+            await packs.async_get(locale)
+        _LOGGER.debug(
+            "Warmed up language packs for %s in %.1fms",
+            locales,
+            (time.perf_counter() - start) * 1000,
+        )
+
+    def _record_locale(self, locale: str) -> None:
+        """Record a used locale to warm up after a restart."""
+        locale = LanguagePacks.pack_name(locale)
+        if self.recent_locales[:1] == [locale]:
+            return
+        if locale in self.recent_locales:
+            self.recent_locales.remove(locale)
+        self.recent_locales = [locale, *self.recent_locales][:RECENT_LOCALES_MAX]
+        self.store.async_delay_save(
+            lambda: {"recent_locales": self.recent_locales}, 30
+        )
+
     async def async_unload(self) -> bool:
         """Unload the Translator."""
-        # Currently nothing to unload
+        if self.agent_translator:
+            await self.agent_translator.async_unload()
+        # Recompile packs on reload to pick up override file changes
+        LanguagePacks.get(self.hass).clear()
         return True
 
+    def _tiers(
+        self,
+    ) -> list[tuple[str, TimeSentenceTranslator | ConversationAgentTranslator]]:
+        """Return translators in the order they should be tried."""
+        tiers = []
+        if self.translator:
+            tiers.append((TranslationTier.LOCAL, self.translator))
+        if self.agent_translator:
+            tiers.append((TranslationTier.AGENT, self.agent_translator))
+        return tiers
+
     async def translate_time(self, text: str, locale: str = "en") -> str:
         """Translate the given text."""
         if self.translator is None:
@@ -59,13 +188,188 @@ class Translator:
 
         return await self.translator.translate(text, locale=locale)
 
+    def _get_fast_path(self, locale: str) -> FastPathRecognizer | None:
+        """Get the fast path recognizer for a locale if its packs are loaded."""
+        locale = LanguagePacks.pack_name(locale)
+        if (recognizer := self.fast_paths.get(locale)) is None:
+            packs = LanguagePacks.get(self.hass)
+            pack = packs.get_loaded(locale)
+            normaliser_pack = packs.get_loaded(NORMALISER_PACK)
+            if not pack or not normaliser_pack:
+                # Packs will be loaded by the full pipeline
+                return None
+            recognizer = FastPathRecognizer(self.hass, pack, normaliser_pack)
+            self.fast_paths[locale] = recognizer
+            self.fast_path_stats[locale] = TierStats()
+        return recognizer
+
+    def _fast_path(
+        self, recognizer: FastPathRecognizer, text: str
+    ) -> tuple[tuple[str, TimerInfo] | None, float]:
+        """Run the fast path.  Returns result and time taken."""
+        start = time.perf_counter()
+        result = recognizer.recognise(text)
+        return result, (time.perf_counter() - start) * 1000
+
+    def _record_fast_path(
+        self, locale: str, text: str, hit: bool, elapsed_ms: float
+    ) -> None:
+        """Record stats for a fast path attempt."""
+        self.fast_path_stats[LanguagePacks.pack_name(locale)].record(hit, elapsed_ms)
+        if hit:
+            _LOGGER.debug("Fast path decoded '%s' in %.2fms", text, elapsed_ms)
+
+    def _record_decode(
+        self, tier: str, text: str, timer_info: TimerInfo | None, elapsed_ms: float
+    ) -> None:
+        """Record stats for a decode attempt."""
+        self.stats[tier].record(timer_info is not None, elapsed_ms)
+        _LOGGER.debug(
+            "Translation tier %s %s '%s' in %.1fms",
+            tier,
+            "decoded" if timer_info else "failed to decode",
+            text,
+            elapsed_ms,
+        )
+
+    async def decode_time(
+        self, text: str, locale: str = "en", type_hint: str | None = None
+    ) -> tuple[str | None, TimerInfo | None]:
+        """Translate and normalise text into a TimerInfo.
+
+        Returns the translated sentence and TimerInfo of the first tier that
+        decodes the text.
+        """
+        self._record_locale(locale)
+
+        if recognizer := self._get_fast_path(locale):
+            result, elapsed_ms = self._fast_path(recognizer, text)
+            self._record_fast_path(locale, text, result is not None, elapsed_ms)
+            if result:
+                return result
+
+        translated = None
+        for tier, translator in self._tiers():
+            start = time.perf_counter()
+            timer_info = None
+            if translated := await translator.translate(text, locale=locale):
+                timer_info = await Normaliser(self.hass, locale=locale).normalise(
+                    translated, type_hint=type_hint
+                )
+            self._record_decode(
+                tier, text, timer_info, (time.perf_counter() - start) * 1000
+            )
+            if timer_info:
+                return translated, timer_info
+        return translated, None
+
+    async def decode_times(
+        self, texts: list[str], locale: str = "en", type_hint: str | None = None
+    ) -> list[tuple[str | None, TimerInfo | None]]:
+        """Translate and normalise a list of texts into TimerInfos.
+
+        The local tier decodes all texts in one executor job sharing the
+        compiled language packs.  Only texts it cannot decode are passed to
+        the conversation agent.
+        """
+        self._record_locale(locale)
+        results: list[tuple[str | None, TimerInfo | None]] = [(None, None)] * len(
+            texts
+        )
+
+        translator = TimeSentenceTranslator(self.hass, self.config)
+        normaliser = Normaliser(self.hass, locale=locale)
+        if (
+            await translator.async_load_language_pack(locale)
+            and await normaliser.async_load_language_packs()
+        ):
+            recognizer = self._get_fast_path(locale)
+            decoded = await self.hass.async_add_executor_job(
+                self._decode_batch, translator, normaliser, recognizer, texts, type_hint
+            )
+            for idx, (translated, timer_info, fast_ms, elapsed_ms) in enumerate(
+                decoded
+            ):
+                if fast_ms is not None:
+                    self._record_fast_path(
+                        locale, texts[idx], elapsed_ms is None, fast_ms
+                    )
+                if elapsed_ms is not None:
+                    self._record_decode(
+                        TranslationTier.LOCAL, texts[idx], timer_info, elapsed_ms
+                    )
+                results[idx] = (translated, timer_info)
+
+        if self.agent_translator:
+            for idx, (_, timer_info) in enumerate(results):
+                if timer_info is not None:
+                    continue
+                start = time.perf_counter()
+                if translated := await self.agent_translator.translate(
+                    texts[idx], locale=locale
+                ):
+                    timer_info = await Normaliser(self.hass, locale=locale).normalise(
+                        translated, type_hint=type_hint
+                    )
+                self._record_decode(
+                    TranslationTier.AGENT,
+                    texts[idx],
+                    timer_info,
+                    (time.perf_counter() - start) * 1000,
+                )
+                results[idx] = (translated, timer_info)
+
+        return results
+
+    def _decode_batch(
+        self,
+        translator: TimeSentenceTranslator,
+        normaliser: Normaliser,
+        recognizer: FastPathRecognizer | None,
+        texts: list[str],
+        type_hint: str | None = None,
+    ) -> list[tuple[str, TimerInfo | None, float | None, float | None]]:
+        """Decode texts with loaded language packs.  Runs in executor.
+
+        Returns translated text, TimerInfo, fast path time and full pipeline
+        time (None if not run) for each text.
+        """
+        decoded = []
+        for text in texts:
+            fast_ms = None
+            if recognizer:
+                result, fast_ms = self._fast_path(recognizer, text)
+                if result:
+                    decoded.append((*result, fast_ms, None))
+                    continue
+            start = time.perf_counter()
+            timer_info = None
+            if translated := translator.translate_sentence(text):
+                timer_info = normaliser.normalise_sentence(
+                    translated, type_hint=type_hint
+                )
+            decoded.append(
+                (translated, timer_info, fast_ms, (time.perf_counter() - start) * 1000)
+            )
+        return decoded
+
     async def translate_time_response(
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
         """Translate the given response."""
-        if self.translator is None:
-            return None
+        for _, translator in self._tiers():
+            if response := await translator.translate_response(
+                sentence_id, params=params, locale=locale
+            ):
+                return response
+        return None
 
-        return await self.translator.translate_response(
-            sentence_id, params=params, locale=locale
-        )
+    def get_stats(self) -> dict[str, Any]:
+        """Return per tier translation stats."""
+        stats: dict[str, Any] = {
+            tier: stats.as_dict() for tier, stats in self.stats.items()
+        }
+        stats["fast_path"] = {
+            locale: stats.as_dict() for locale, stats in self.fast_path_stats.items()
+        }
+        return stats
@@ -0,0 +1,157 @@
+"""Persistent cache for conversation agent translations.
+
+Conversation agent (LLM) translations take seconds per call, so results are
+stored in an HA Store keyed by (engine, locale, prompt).  Concurrent requests
+for the same key are coalesced into a single in-flight agent call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import hashlib
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ...const import DOMAIN  # noqa: TID252
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSLATIONS_STORE_NAME = f"{DOMAIN}.translations"
+
+# Max age of a cached translation in seconds (30 days)
+CACHE_TTL = 30 * 24 * 60 * 60
+# Max number of cached translations
+CACHE_MAX_ENTRIES = 1000
+# Delay before writing changes to disk
+CACHE_SAVE_DELAY = 30
+
+
+class TranslationCache:
+    """Class to manage the persistent translation cache."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: int = CACHE_TTL,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.store = Store(hass, 1, TRANSLATIONS_STORE_NAME)
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.loaded = False
+
+        self._pending: dict[str, asyncio.Task] = {}
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """Load cache from store."""
+        async with self._load_lock:
+            if self.loaded:
+                return
+            try:
+                if stored := await self.store.async_load():
+                    self.entries = stored.get("entries", {})
+            except Exception as ex:  # noqa: BLE001
+                _LOGGER.error("Error loading translation cache. Error is %s", ex)
+                self.entries = {}
+            self.loaded = True
+            if self._purge_expired():
+                self._schedule_save()
+
+    async def save(self) -> None:
+        """Write cache to store now."""
+        if self.loaded:
+            await self.store.async_save(self._data_to_save())
+
+    @staticmethod
+    def make_key(engine: str | None, locale: str, prompt: str) -> str:
+        """Make cache key for an engine, locale and prompt."""
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()  # noqa: S324
+        return f"{engine}|{locale}|{digest}"
+
+    def get(self, key: str) -> str | None:
+        """Get an unexpired cached value."""
+        if entry := self.entries.get(key):
+            if time.time() - entry["created_at"] < self.ttl:
+                # Move to end to keep most recently used entries on eviction
+                self.entries[key] = self.entries.pop(key)
+                return entry["value"]
+            self.entries.pop(key, None)
+            self._schedule_save()
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Add a value to the cache."""
+        self.entries.pop(key, None)
+        self.entries[key] = {"value": value, "created_at": round(time.time())}
+        while len(self.entries) > self.max_entries:
+            self.entries.pop(next(iter(self.entries)))
+        self._schedule_save()
+
+    async def async_get_or_fetch(
+        self,
+        engine: str | None,
+        locale: str,
+        prompt: str,
+        fetch: Callable[[], Awaitable[str | None]],
+    ) -> str | None:
+        """Get a cached translation or fetch it.
+
+        Concurrent calls for the same key share a single fetch.
+        """
+        if not self.loaded:
+            await self.load()
+
+        key = self.make_key(engine, locale, prompt)
+        if (value := self.get(key)) is not None:
+            _LOGGER.debug("Translation cache hit for %s", key)
+            return value
+
+        if (task := self._pending.get(key)) is None:
+            task = self.hass.async_create_task(
+                self._async_fetch(key, fetch), name=f"VA translation {key}"
+            )
+            self._pending[key] = task
+        else:
+            _LOGGER.debug("Joining in-flight translation for %s", key)
+
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[str | None]]
+    ) -> str | None:
+        """Fetch a value and add it to the cache."""
+        try:
+            if value := await fetch():
+                self.set(key, value)
+            return value
+        finally:
+            self._pending.pop(key, None)
+
+    def _purge_expired(self) -> bool:
+        """Remove expired entries.  Returns if any removed."""
+        now = time.time()
+        expired = [
+            key
+            for key, entry in self.entries.items()
+            if now - entry.get("created_at", 0) >= self.ttl
+        ]
+        for key in expired:
+            self.entries.pop(key, None)
+        return bool(expired)
+
+    def _schedule_save(self) -> None:
+        """Schedule a delayed save of the cache."""
+        self.store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to save."""
+        return {"entries": self.entries}
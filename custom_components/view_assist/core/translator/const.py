@@ -0,0 +1,98 @@
+"""Constants for the translator."""
+
+from enum import StrEnum
+
+
+class LangPackKeys(StrEnum):
+    """Keys for language pack entries."""
+
+    NUMBERS = "numbers"
+    DAYS = "days"
+    DURATIONS = "durations"
+    OPERATORS = "operators"
+    TIME_OF_DAY = "time_of_day"
+    FRACTIONS = "fractions"
+    DIRECT_TRANSLATIONS = "direct_translations"
+    COMPOUND_WORDS = "compound_words"
+    OTHER_WORDS = "other_words"
+
+
+class LangPackKeys2(StrEnum):
+    """Keys for language pack entries."""
+
+    DECIMAL_SEPARATOR = "decimal_separator"
+
+
+class NormaliserPackKeys(StrEnum):
+    """Keys for normaliser language pack."""
+
+    DAYS = "days"
+    MERIDIEM = "meridiem"
+    DURATIONS = "durations"
+    OPERATORS = "operators"
+    SPECIAL_HOURS = "special_hours"
+    TIME_OF_DAY = "time_of_day"
+    FRACTIONS = "fractions"
+    DIRECT_TRANSLATIONS = "direct_translations"
+    REMOVE_WORDS = "remove_words"
+    STRUCTURES = "structures"
+
+
+# TODO: Build regex patterns from normalisation language pack
+class RegexPatterns:
+    """Regex time patterns for matching."""
+
+    STDTIME = r"(?P<hours>\d{1,2})(?::|h|\s)?(?P<minutes>\d{1,2})?"
+    DAYS = r"(?P<days>\d+)"
+    HOURS = r"(?P<hours>\d{1,2})"
+    MINUTES = r"(?P<minutes>\d{1,2})"
+    FRACTIONS = r"(?P<fractions>half|quarter|threequarter)"
+    TIMEOFDAY = r"(?P<time_of_day>am|pm|morning|afternoon|evening|night|tonight)"
+    DAY = r"(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday|today|tomorrow)"
+    SPECIAL_HOUR = r"(?P<special_hour>noon|midnight)"
+    OPERATOR = r"(?P<operator>and|minus|after|before)"
+    JOINER_WORDS = r"(?:on|this|at|,)"
+
+
+class RegexDurationPatterns:
+    """Regex patterns for matching durations."""
+
+    DAYS = r"((?P<days>\d{1,2}(.\d+)?)(?:\s)?(?:days|day|d)\b)?"
+    HOURS = r"((?P<hours>\d{1,2}(.\d+)?)(?:\s)?(?:hours|hour|h)\b)?"
+    MINUTES = r"((?P<minutes>\d{1,2}(.\d+)?)(?:\s)?(?:minutes|minute|mins|min|m)\b)?"
+    SECONDS = r"((?P<seconds>\d{1,2})(?:\s)?(?:seconds|second|secs|sec|s)\b)?"
+    JOIN = r"(?:,\s|\sand\s|\s)?"
+
+
+REGEXLOOKUP = {
+    "std_time": RegexPatterns.STDTIME,
+    "days": RegexPatterns.DAYS,
+    "hours": RegexPatterns.HOURS,
+    "minutes": RegexPatterns.MINUTES,
+    "fractions": RegexPatterns.FRACTIONS,
+    "time_of_day": RegexPatterns.TIMEOFDAY,
+    "day": RegexPatterns.DAY,
+    "special_hour": RegexPatterns.SPECIAL_HOUR,
+    "operator": RegexPatterns.OPERATOR,
+    "joiner_words": RegexPatterns.JOINER_WORDS,
+}
+
+
+STD_TIME_PATTERNS = [
+    "{special_hour}",
+    "{std_time}",
+    "{std_time}{time_of_day}",
+    "{std_time} {time_of_day}",
+    "{std_time} {time_of_day} {day}",
+    "{std_time} {day}",
+    "{std_time} {day} {time_of_day}",
+    "{std_time} {joiner_words} {time_of_day}",
+    "{std_time} {joiner_words} {day}",
+    "{std_time} {joiner_words} {day} {time_of_day}",
+    "{day} {std_time}",
+    "{day} {std_time} {time_of_day}",
+    "{day} {joiner_words} {std_time}",
+    "{day} {joiner_words} {std_time} {time_of_day}",
+    "{day} {joiner_words} {time_of_day}",
+    "{day} {joiner_words} {special_hour}",
+]
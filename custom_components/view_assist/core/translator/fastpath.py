@@ -0,0 +1,258 @@
+"""Fast path recognizer for simple time sentences.
+
+Most time sentences are simple, ie '5 minutes', '1 hour and 30 minutes',
+'5 30 pm' or '5 oclock tomorrow'.  These are recognised in a single token pass
+using word tables built from the compiled language packs and return a
+TimerInfo without running the full translate and normalise pipeline.  Any
+sentence outside this small grammar returns None to fall through to it.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+from homeassistant.core import HomeAssistant
+
+from .const import NormaliserPackKeys
+from .langpack import (
+    DURATION_REGEX,
+    STD_TIME_REGEXES,
+    TRANSLATION_COLLECTIONS,
+    CompiledLanguagePack,
+)
+from .normaliser import Normaliser, TimerInfo
+
+# Duration units in the order the duration pattern expects them
+UNITS = ["days", "hours", "minutes", "seconds"]
+
+UNIT_WORDS = {
+    "days": ["day", "d"],
+    "hours": ["hour", "h"],
+    "minutes": ["minute", "mins", "min", "m"],
+    "seconds": ["second", "secs", "sec", "s"],
+}
+
+DAY_WORDS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+    "today",
+    "tomorrow",
+]
+
+OCLOCK = "oclock"
+
+# Max digits of values in std time and duration patterns
+MAX_VALUE = 99
+
+
+class Token(StrEnum):
+    """Token kinds of the fast path grammar."""
+
+    NUMBER = "number"
+    TIME = "time"
+    UNIT = "unit"
+    MERIDIEM = "meridiem"
+    OCLOCK = "oclock"
+    DAY = "day"
+    AND = "and"
+    IGNORE = "ignore"
+
+
+class FastPathRecognizer:
+    """Recognise simple time and interval sentences for a locale."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pack: CompiledLanguagePack,
+        normaliser_pack: CompiledLanguagePack,
+    ) -> None:
+        """Initialise and build word tables from the language packs."""
+        self.numbers = pack.numbers
+        self.structures = pack.structures
+        self.normaliser = Normaliser(hass, locale=pack.name)
+
+        # English word -> (token kind, canonical word)
+        english: dict[str, tuple[Token, str]] = {}
+        for unit in UNITS:
+            english[unit] = (Token.UNIT, unit)
+            for word in UNIT_WORDS[unit]:
+                english[word] = (Token.UNIT, unit)
+        for day in DAY_WORDS:
+            english[day] = (Token.DAY, day)
+        english[OCLOCK] = (Token.OCLOCK, OCLOCK)
+        english["and"] = (Token.AND, "and")
+
+        data = normaliser_pack.data
+        for unit, variants in data.get(NormaliserPackKeys.DURATIONS, {}).items():
+            for variant in [unit, *variants]:
+                english.setdefault(variant, (Token.UNIT, unit))
+        for meridiem, variants in data.get(NormaliserPackKeys.MERIDIEM, {}).items():
+            for variant in [meridiem, *variants]:
+                english.setdefault(variant, (Token.MERIDIEM, meridiem))
+        for variant in data.get(NormaliserPackKeys.FRACTIONS, {}).get(OCLOCK, []):
+            english.setdefault(variant, (Token.OCLOCK, OCLOCK))
+        for word in data.get(NormaliserPackKeys.REMOVE_WORDS, []):
+            english.setdefault(word, (Token.IGNORE, word))
+
+        # Local words take precedence in the order the translator applies
+        # collections, so a word means the same as in the full pipeline
+        self.words: dict[str, tuple[Token, str] | None] = {}
+        for col in TRANSLATION_COLLECTIONS:
+            if collection := pack.collections.get(col):
+                for local, translation in collection.translations.items():
+                    if " " not in local:
+                        self.words.setdefault(local, english.get(translation))
+        for word, token in english.items():
+            if " " not in word:
+                self.words.setdefault(word, token)
+
+    def _tokenise(self, sentence: str) -> list[tuple[Token, str]] | None:
+        """Tokenise sentence.  Returns None if any word is not in the grammar."""
+        tokens = []
+        for word in self.numbers.to_digits(sentence).split():
+            word = word.rstrip(",")
+            if word.isdigit():
+                tokens.append((Token.NUMBER, word))
+            elif (
+                ":" in word
+                and (parts := word.split(":"))
+                and len(parts) == 2
+                and all(part.isdigit() for part in parts)
+            ):
+                tokens.append((Token.TIME, word))
+            elif token := self.words.get(word):
+                if token[0] != Token.IGNORE:
+                    tokens.append(token)
+            else:
+                return None
+        return tokens
+
+    def _match_interval(
+        self, tokens: list[tuple[Token, str]]
+    ) -> tuple[str, dict[str, str]] | None:
+        """Match <n> <unit> [[and] <n> <unit>]..."""
+        d: dict[str, str] = {}
+        parts = []
+        last_unit = -1
+        idx = 0
+        while idx < len(tokens):
+            if d and tokens[idx][0] == Token.AND:
+                idx += 1
+            if (
+                idx + 1 >= len(tokens)
+                or tokens[idx][0] != Token.NUMBER
+                or tokens[idx + 1][0] != Token.UNIT
+            ):
+                return None
+            value, unit = tokens[idx][1], tokens[idx + 1][1]
+            if int(value) > MAX_VALUE or UNITS.index(unit) <= last_unit:
+                return None
+            last_unit = UNITS.index(unit)
+            d[unit] = value
+            parts.append(f"{value} {unit[:-1] if value == '1' else unit}")
+            idx += 2
+        return (" and ".join(parts), d) if d else None
+
+    def _match_time(
+        self, tokens: list[tuple[Token, str]]
+    ) -> tuple[str, dict[str, str], str] | None:
+        """Match (<h> [<m>] | <h:m>) [oclock] [am/pm] [day]."""
+        kinds = [token[0] for token in tokens]
+        d: dict[str, str] = {}
+        idx = 0
+        if kinds[:1] == [Token.TIME]:
+            d["hours"], d["minutes"] = tokens[0][1].split(":")
+            idx = 1
+        elif kinds[:2] == [Token.NUMBER, Token.NUMBER]:
+            d["hours"], d["minutes"] = tokens[0][1], tokens[1][1]
+            idx = 2
+        elif kinds[:1] == [Token.NUMBER]:
+            d["hours"] = tokens[0][1]
+            idx = 1
+        else:
+            return None
+
+        if any(len(v) > 2 for v in d.values()):
+            return None
+
+        has_suffix = False
+        if kinds[idx : idx + 1] == [Token.OCLOCK]:
+            has_suffix = True
+            idx += 1
+        if kinds[idx : idx + 1] == [Token.MERIDIEM]:
+            d["time_of_day"] = tokens[idx][1]
+            idx += 1
+        if kinds[idx : idx + 1] == [Token.DAY]:
+            d["day"] = tokens[idx][1]
+            idx += 1
+
+        if idx != len(tokens) or not (has_suffix or "time_of_day" in d or "day" in d):
+            return None
+
+        # Match the std time pattern name the normaliser would report
+        std_time = (":" if kinds[0] == Token.TIME else " ").join(
+            v for v in (d["hours"], d.get("minutes")) if v
+        )
+        if has_suffix:
+            std_time += f" {OCLOCK}"
+        if "time_of_day" in d and "day" not in d and "minutes" not in d:
+            pattern = "{std_time}{time_of_day}"
+        else:
+            pattern = "{std_time}"
+            if "time_of_day" in d:
+                pattern += " {time_of_day}"
+            if "day" in d:
+                pattern += " {day}"
+        translated = " ".join(
+            v for v in (std_time, d.get("time_of_day"), d.get("day")) if v
+        )
+        return translated, d, pattern
+
+    def _pipeline_pattern(self, translated: str) -> str | None:
+        """Get the pattern the full pipeline would match a translated sentence on.
+
+        The normaliser tries std time patterns, then the language pack
+        structures, then durations.  Returns None for a structure match, as the
+        fast path does not build structure results.
+        """
+        s = " ".join(translated.replace(OCLOCK, "").split())
+        for std_time_pattern, regex in STD_TIME_REGEXES:
+            if regex.match(s):
+                return std_time_pattern
+        if any(regex.match(s) for _, regex in self.structures):
+            return None
+        if DURATION_REGEX.match(s):
+            return "durations"
+        return None
+
+    def recognise(self, sentence: str) -> tuple[str, TimerInfo] | None:
+        """Recognise a sentence.  Returns translated sentence and TimerInfo.
+
+        A match is only returned if the full pipeline would decode the sentence
+        with the same pattern, otherwise it falls through to it.
+        """
+        if not (tokens := self._tokenise(sentence.lower())):
+            return None
+
+        if match := self._match_interval(tokens):
+            translated, d = match
+            if self._pipeline_pattern(translated) != "durations":
+                return None
+            return translated, self.normaliser.build_timer_info(
+                d, sentence=translated, pattern="durations", type_hint="interval"
+            )
+
+        if match := self._match_time(tokens):
+            translated, d, pattern = match
+            if self._pipeline_pattern(translated) != pattern:
+                return None
+            return translated, self.normaliser.build_timer_info(
+                d, sentence=translated, pattern=pattern, type_hint="time"
+            )
+        return None
@@ -0,0 +1,339 @@
+"""Compiled timer language packs.
+
+Language packs (translations/timers/<lang>.json), merged with any user override
+in config/view_assist/translations/timers/<lang>.json, are compiled into a
+CompiledLanguagePack holding the number word converter and precompiled regex
+patterns.  Compiled packs are cached in memory until the integration is
+unloaded, so edits to override files are picked up on reload.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import re
+from typing import Any, NamedTuple
+
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN
+from .const import (
+    REGEXLOOKUP,
+    STD_TIME_PATTERNS,
+    LangPackKeys,
+    NormaliserPackKeys,
+    RegexDurationPatterns,
+)
+from .wordstonumbers import WordsToDigits, english_converter
+
+_LOGGER = logging.getLogger(__name__)
+
+LANGPACK_DIR = "translations/timers"
+NORMALISER_PACK = "normaliser"
+
+# Order collections are translated in by TimeSentenceTranslator
+TRANSLATION_COLLECTIONS = [
+    LangPackKeys.TIME_OF_DAY,
+    LangPackKeys.DAYS,
+    LangPackKeys.FRACTIONS,
+    LangPackKeys.DURATIONS,
+    LangPackKeys.OPERATORS,
+    LangPackKeys.OTHER_WORDS,
+    LangPackKeys.DIRECT_TRANSLATIONS,
+]
+
+# Order collections are normalised in by Normaliser
+NORMALISER_COLLECTIONS = [
+    NormaliserPackKeys.DIRECT_TRANSLATIONS,
+    NormaliserPackKeys.DURATIONS,
+    NormaliserPackKeys.OPERATORS,
+    NormaliserPackKeys.MERIDIEM,
+    NormaliserPackKeys.FRACTIONS,
+    NormaliserPackKeys.SPECIAL_HOURS,
+]
+
+
+def word_pattern(words: str | list[str]) -> str:
+    """Make a regex pattern to find any of the words in a string."""
+    if isinstance(words, list):
+        words = "|".join(re.escape(w) for w in words if w)
+    return r"(?:^|\b)(" + words + r")(?:,|\b|$)"
+
+
+def replace_pattern(word: str) -> str:
+    """Make a regex pattern to replace a found word in a string."""
+    return r"(^|\b)(" + word.strip() + r")(,|\W|\b|$)"
+
+
+def template_pattern(template: str) -> str:
+    """Make a regex pattern from a structure pattern."""
+    pattern = template
+    # Find all matching {parameters}
+    for key, sub in REGEXLOOKUP.items():
+        pattern = pattern.replace("{" + key + "}", sub)
+
+    # Optional items are wrapped in []
+    optional_items: list[str] = re.findall(r"\[(.*?)\]", pattern)
+    for items in optional_items:
+        optional = [item.strip() for item in items.strip().split(",")]
+        pattern = pattern.replace(
+            f"[{items}] ", rf"(?:^|\b)(?:{'|'.join(optional)}\s)?"
+        )
+    return r"^" + pattern + r"$"
+
+
+def duration_pattern() -> str:
+    """Make a regex pattern for durations."""
+    days = RegexDurationPatterns.DAYS
+    hours = RegexDurationPatterns.HOURS
+    minutes = RegexDurationPatterns.MINUTES
+    seconds = RegexDurationPatterns.SECONDS
+    join = RegexDurationPatterns.JOIN
+    return f"^{days}{join}{hours}{join}{minutes}{join}{seconds}$"
+
+
+# These do not depend on a language pack so are compiled once on import
+STD_TIME_REGEXES = [(t, re.compile(template_pattern(t))) for t in STD_TIME_PATTERNS]
+DURATION_REGEX = re.compile(duration_pattern())
+
+
+def flatten(lst: list[str | list]) -> list[str]:
+    """Flatten a list of strings and lists into a single list of strings."""
+    flattened = []
+    for item in lst:
+        if isinstance(item, list):
+            flattened.extend(flatten(item))
+        else:
+            flattened.append(item)
+    return list(filter(None, flattened))
+
+
+class CompiledCollection(NamedTuple):
+    """Collection of words with a single pattern to find any of them."""
+
+    pattern: re.Pattern
+    translations: dict[str, str]
+
+
+class CompiledCompound(NamedTuple):
+    """Compound word pattern and its replacement template."""
+
+    pattern: re.Pattern
+    template: str
+    params: list[str]
+
+
+@dataclass
+class CompiledLanguagePack:
+    """Language pack with precompiled lookups and patterns."""
+
+    name: str
+    data: dict[str, Any]
+    numbers: WordsToDigits | None = None
+    collections: dict[str, CompiledCollection] = field(default_factory=dict)
+    compounds: list[CompiledCompound] = field(default_factory=list)
+    structures: list[tuple[str, re.Pattern]] = field(default_factory=list)
+    normalisations: list[tuple[re.Pattern, str]] = field(default_factory=list)
+    remove_words: list[re.Pattern] = field(default_factory=list)
+
+
+def _compile_collection(collection: dict[str, list[str] | str]) -> CompiledCollection:
+    """Compile a collection of translation: local words."""
+    translations: dict[str, str] = {}
+    for translation, words in collection.items():
+        for word in words if isinstance(words, list) else [words]:
+            if word:
+                translations.setdefault(word, translation)
+
+    # Order by those with spaces first and then longer words first
+    words = sorted(translations, key=lambda x: (-len(x.split()), -len(x)))
+    return CompiledCollection(re.compile(word_pattern(words)), translations)
+
+
+def _compile_compounds(data: dict[str, Any]) -> list[CompiledCompound]:
+    """Compile compound word templates to regex patterns."""
+    compounds: list[CompiledCompound] = []
+    for compound, template in data.get(LangPackKeys.COMPOUND_WORDS, {}).items():
+        if "{" not in compound or "}" not in compound:
+            continue
+
+        # It's a template with parameters, build search regex
+        params = re.findall(r"\{(.*?)\}", compound)
+        pattern = re.escape(compound)
+        for param in params:
+            if ":" in param:
+                # TODO: Use langpack enum to allow any of these types
+                p_name, p_type = param.split(":", 1)
+                values = []
+                if p_type in (
+                    LangPackKeys.NUMBERS,
+                    LangPackKeys.DAYS,
+                    LangPackKeys.TIME_OF_DAY,
+                ):
+                    values = flatten(data.get(p_type, {}).values())
+                if values:
+                    pattern = pattern.replace(
+                        r"\{" + param + r"\}",
+                        r"(?P<" + p_name + r">" + "|".join(values) + r")",
+                    )
+            else:
+                pattern = pattern.replace(
+                    r"\{" + param + r"\}", r"(?P<" + param + r">\S+)"
+                )
+        compounds.append(
+            CompiledCompound(
+                re.compile(r"(?:^|\b)" + pattern + r"(?:\b|$)"),
+                template,
+                [param.split(":", 1)[0] for param in params],
+            )
+        )
+    return compounds
+
+
+def _compile_structures(data: dict[str, Any]) -> list[tuple[str, re.Pattern]]:
+    """Compile structures in evaluation order, expanding {basic_time}."""
+    compiled: list[tuple[str, re.Pattern]] = []
+    structures = data.get(NormaliserPackKeys.STRUCTURES, {})
+
+    def add(name: str, template: str) -> None:
+        try:
+            compiled.append((name, re.compile(template_pattern(template))))
+        except re.error as ex:
+            _LOGGER.debug("Invalid language pack structure %s - %s", template, ex)
+
+    # Advanced may ref basic to create more complex patterns
+    for patterns in structures.values():
+        for str_pattern in patterns:
+            if "{basic_time}" in str_pattern:
+                for basic_time_pattern in structures.get("basic_time", []):
+                    add(
+                        basic_time_pattern,
+                        str(str_pattern).replace("{basic_time}", basic_time_pattern),
+                    )
+                continue
+            add(str_pattern, str_pattern)
+    return compiled
+
+
+def compile_language_pack(name: str, data: dict[str, Any]) -> CompiledLanguagePack:
+    """Compile a language pack."""
+    pack = CompiledLanguagePack(name=name, data=data)
+
+    if name == NORMALISER_PACK:
+        for col in NORMALISER_COLLECTIONS:
+            for word, values in data.get(col, {}).items():
+                if values:
+                    pack.normalisations.append(
+                        (re.compile(word_pattern(values)), word)
+                    )
+        pack.remove_words = [
+            re.compile(word_pattern(word))
+            for word in data.get(NormaliserPackKeys.REMOVE_WORDS, [])
+            if word
+        ]
+        return pack
+
+    if name == "en":
+        pack.numbers = english_converter()
+    else:
+        joiners = data.get(LangPackKeys.OPERATORS, {}).get("and") or []
+        if isinstance(joiners, str):
+            joiners = [joiners]
+        pack.numbers = WordsToDigits(data.get(LangPackKeys.NUMBERS, {}), joiners)
+
+    for col in TRANSLATION_COLLECTIONS:
+        if collection := data.get(col):
+            pack.collections[col] = _compile_collection(collection)
+    pack.compounds = _compile_compounds(data)
+    pack.structures = _compile_structures(data)
+    return pack
+
+
+class LanguagePacks:
+    """Class to load and cache compiled language packs."""
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> LanguagePacks:
+        """Get the language packs instance."""
+        data = hass.data.setdefault(DOMAIN, {})
+        if cls.__name__ not in data:
+            data[cls.__name__] = cls(hass)
+        return data[cls.__name__]
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.packs: dict[str, CompiledLanguagePack | None] = {}
+
+    @staticmethod
+    def pack_name(lang: str) -> str:
+        """Get pack name for a locale.  In case like de-DE, make de."""
+        if lang == NORMALISER_PACK:
+            return lang
+        return lang.split("-")[0][:2]
+
+    def get_loaded(self, lang: str) -> CompiledLanguagePack | None:
+        """Get an already loaded pack without any I/O."""
+        return self.packs.get(self.pack_name(lang))
+
+    async def async_get(self, lang: str) -> CompiledLanguagePack | None:
+        """Get a compiled language pack, loading it if needed."""
+        name = self.pack_name(lang)
+        if name in self.packs:
+            return self.packs[name]
+        return await self.hass.async_add_executor_job(self.load, name)
+
+    def load(self, name: str) -> CompiledLanguagePack | None:
+        """Load a compiled language pack.  Runs in executor."""
+        sources = self._source_files(name)
+        if not sources:
+            _LOGGER.error("No language pack found for %s", name)
+            self.packs[name] = None
+            return None
+
+        if (data := self._read_sources(sources)) is None:
+            self.packs[name] = None
+            return None
+
+        pack = self.packs[name] = compile_language_pack(name, data)
+        return pack
+
+    def clear(self) -> None:
+        """Clear compiled packs, so they are reloaded from source."""
+        self.packs = {}
+
+    def _source_files(self, name: str) -> list[Path]:
+        """Get the pack file and any user override for a pack."""
+        pack_file = Path(
+            self.hass.config.path("custom_components", DOMAIN),
+            LANGPACK_DIR,
+            f"{name}.json",
+        )
+        if not pack_file.is_file():
+            return []
+
+        override_file = Path(self.hass.config.path(DOMAIN), LANGPACK_DIR, f"{name}.json")
+        if override_file.is_file():
+            return [pack_file, override_file]
+        return [pack_file]
+
+    def _read_sources(self, sources: list[Path]) -> dict[str, Any] | None:
+        """Read pack json and merge any user override over it."""
+        data: dict[str, Any] = {}
+        for source in sources:
+            try:
+                with source.open("r", encoding="utf-8") as f:
+                    override = json.load(f)
+            except (OSError, json.JSONDecodeError) as ex:
+                _LOGGER.error("Error reading language pack %s - %s", source, ex)
+                if not data:
+                    return None
+                continue
+            for key, value in override.items():
+                if isinstance(value, dict) and isinstance(data.get(key), dict):
+                    data[key] = {**data[key], **value}
+                else:
+                    data[key] = value
+        return data
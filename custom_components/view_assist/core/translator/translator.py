@@ -1,10 +1,8 @@
 """Translator module for handling different languages."""
 
-from enum import EnumType, StrEnum
-import json
+from enum import EnumType
 import logging
 from os import environ
-from pathlib import Path
 import re
 from typing import Any
 
@@ -12,31 +10,14 @@ from homeassistant.components.conversation import async_converse, get_agent_mana
 from homeassistant.core import Context, HomeAssistant
 
 from ...helpers import get_config_entry_by_entity_id, get_key  # noqa: TID252
-from . import DOMAIN, VAConfigEntry
+from . import VAConfigEntry
+from .cache import TranslationCache
+from .const import LangPackKeys, LangPackKeys2
+from .langpack import TRANSLATION_COLLECTIONS, CompiledLanguagePack, LanguagePacks
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class LangPackKeys(StrEnum):
-    """Keys for language pack entries."""
-
-    NUMBERS = "numbers"
-    DAYS = "days"
-    DURATIONS = "durations"
-    OPERATORS = "operators"
-    TIME_OF_DAY = "time_of_day"
-    FRACTIONS = "fractions"
-    DIRECT_TRANSLATIONS = "direct_translations"
-    COMPOUND_WORDS = "compound_words"
-    OTHER_WORDS = "other_words"
-
-
-class LangPackKeys2(StrEnum):
-    """Keys for language pack entries."""
-
-    DECIMAL_SEPARATOR = "decimal_separator"
-
-
 PROJECT_ID = environ.get("PROJECT_ID", "")
 
 
@@ -44,7 +25,8 @@ PROJECT_ID = environ.get("PROJECT_ID", "")
 class ConversationAgentTranslator:
     """Translate text using a conversation agent.
 
-    Basically an LLM translator
+    Basically an LLM translator.  Translations are cached persistently and
+    response templates are translated once per locale and rendered locally.
     """
 
     INSTRUCTIONS = """Translate the text in quotation marks from {}.  All numbers should be digits and not words.
@@ -53,11 +35,14 @@ class ConversationAgentTranslator:
 
     RESPONSE = """Translate the text in quotation marks into a time or interval sentence in a spoken style in the language of locale {}.  The text is '{}'."""
 
+    RESPONSE_TEMPLATE = """Translate the text in quotation marks into the language of locale {}.  Keep any words in curly brackets, including the brackets, exactly as they are.  Only return the translated text.  The text is '{}'."""
+
     def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
         """Initialise the conversation agent translator."""
         self.hass = hass
         self.agent_id = None
         self.config = config
+        self.cache = TranslationCache(hass)
 
         self.responses = {
             "timer_set": "Timer set for {time}",
@@ -71,11 +56,29 @@ class ConversationAgentTranslator:
             "timer_error": "Unable to decode time or interval information",
         }
 
+    @property
+    def engine(self) -> str | None:
+        """Return the configured translation engine."""
+        return self.config.runtime_data.integration.translation_engine
+
+    async def async_setup(self) -> None:
+        """Load the translation cache and pre-translate responses."""
+        await self.cache.load()
+        # Pre-translate response templates for the HA language in the background
+        self.config.async_create_background_task(
+            self.hass,
+            self.async_pretranslate_responses(self.hass.config.language),
+            name="VA pre-translate responses",
+        )
+
+    async def async_unload(self) -> None:
+        """Write any pending cache changes."""
+        await self.cache.save()
+
     async def _agent_translation(self, sentence: str, locale: str) -> str:
         """Translate text using the conversation agent."""
         am = get_agent_manager(self.hass)
-        agent_entity = self.config.runtime_data.integration.translation_engine
-        if agent_config := get_config_entry_by_entity_id(self.hass, agent_entity):
+        if agent_config := get_config_entry_by_entity_id(self.hass, self.engine):
             self.agent_id = agent_config.entry_id
 
         if am.async_is_valid_agent_id(self.agent_id):
@@ -88,35 +91,90 @@ class ConversationAgentTranslator:
                 language=locale,
                 agent_id=self.agent_id,
             )
-            _LOGGER.warning("Response: %s", response.as_dict())
+            _LOGGER.debug("Response: %s", response.as_dict())
             if output := get_key("response.speech.plain.speech", response.as_dict()):
                 return output
             _LOGGER.warning("No output from conversation agent")
+            return None
         _LOGGER.error("Invalid translation engine provided")
         return None
 
+    async def _cached_agent_translation(self, prompt: str, locale: str) -> str | None:
+        """Translate text using the cache or the conversation agent."""
+        return await self.cache.async_get_or_fetch(
+            self.engine,
+            locale,
+            prompt,
+            lambda: self._agent_translation(prompt, locale),
+        )
+
     async def translate(self, sentence: str, locale: str) -> str:
         """Translate text to the target language using the conversation agent."""
-        return await self._agent_translation(
+        return await self._cached_agent_translation(
             self.INSTRUCTIONS.format(locale, sentence), locale
         )
 
+    async def _get_response_template(
+        self, sentence_id: str, locale: str
+    ) -> str | None:
+        """Get a response template translated into the locale language.
+
+        Returns None if the translated template did not keep its parameters.
+        """
+        template = self.responses[sentence_id]
+        if locale[:2] == "en":
+            return template
+
+        translated = await self._cached_agent_translation(
+            self.RESPONSE_TEMPLATE.format(locale, template), locale
+        )
+        if translated:
+            translated = translated.strip().strip("'\"")
+            if set(re.findall(r"\{(\w+)\}", translated)) == set(
+                re.findall(r"\{(\w+)\}", template)
+            ):
+                return translated
+            _LOGGER.debug(
+                "Translated response template %s for %s lost its parameters: %s",
+                sentence_id,
+                locale,
+                translated,
+            )
+        return None
+
+    async def async_pretranslate_responses(self, locale: str) -> None:
+        """Translate all response templates for a locale into the cache.
+
+        Templates are translated one at a time as agent calls share a
+        conversation, so concurrent prompts could get each other's answers.
+        """
+        if locale[:2] == "en":
+            return
+        for sentence_id in self.responses:
+            await self._get_response_template(sentence_id, locale)
+
     async def translate_response(
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
         """Translate a response sentence id with optional params."""
         if sentence_id in self.responses:
-            sentence = self.responses[sentence_id]
+            params = params or {}
 
             # set time param to time_{lang} param
             params["time"] = params.get(f"time_{locale}", params.get("time_en"))
 
-            # Replace params in sentence
-            if params:
+            if template := await self._get_response_template(sentence_id, locale):
+                # Render translated template locally
                 for k, v in params.items():
-                    sentence = sentence.replace(f"{{{k}}}", str(v))
+                    template = template.replace(f"{{{k}}}", str(v))
+                return template
+
+            # Fallback to translating the full sentence
+            sentence = self.responses[sentence_id]
+            for k, v in params.items():
+                sentence = sentence.replace(f"{{{k}}}", str(v))
 
-            return await self._agent_translation(
+            return await self._cached_agent_translation(
                 self.RESPONSE.format(locale, sentence), locale
             )
         return None
@@ -130,31 +188,26 @@ class TimeSentenceTranslator:
         self.hass = hass
         self.loaded_lang: str | None = None
         self.lang: dict[str, Any] = {}
+        self.pack: CompiledLanguagePack | None = None
         self.config = config
 
     def _two_char_locale(self, lang: str) -> str:
         """Convert locale to two character format."""
         return lang[:2]
 
-    def load_language_pack(self, lang: str) -> bool:
-        """Load language pack."""
-        # Get current path of this file
-        p = self.hass.config.path("custom_components", DOMAIN)
+    async def async_load_language_pack(self, lang: str) -> bool:
+        """Load compiled language pack."""
         # In case like de-DE, make de
         lang = self._two_char_locale(lang)
-        lang_file = Path(p, "translations", "timers", f"{lang}.json")
-
-        if lang_file.is_file():
-            try:
-                with lang_file.open("r", encoding="utf-8") as f:
-                    self.lang = json.load(f)
-                    self.loaded_lang = lang
-                    return True
-            except json.JSONDecodeError:
-                _LOGGER.error("Error reading language pack for %s", lang)
-        else:
-            _LOGGER.error("No language pack found for %s -> %s", lang, lang_file)
-        return False
+        if self.pack is None or self.loaded_lang != lang:
+            self.pack = await LanguagePacks.get(self.hass).async_get(lang)
+            if self.pack is None:
+                self.loaded_lang = None
+                self.lang = {}
+                return False
+            self.lang = self.pack.data
+            self.loaded_lang = lang
+        return True
 
     def inString(self, string: str, find: str | list[str] | EnumType) -> str | None:
         """Check if any of the find words are in the string."""
@@ -199,100 +252,27 @@ class TimeSentenceTranslator:
 
     def _translate_collection(self, string: str, collection_id: LangPackKeys) -> str:
         """Translate all entries in a collection."""
-        collection: dict[str, list[str] | str] = self.lang.get(collection_id)
-        if not collection:
+        if not (collection := self.pack.collections.get(collection_id)):
             return string
 
-        # make into big list of words to match
-        collection_words = []
-        for entry in collection.values():
-            if isinstance(entry, list):
-                collection_words.extend(entry)
-            else:
-                collection_words.append(entry)
-
-        # Order by those with spaces first and then longer words first
-        collection_words = sorted(
-            collection_words, key=lambda x: (-len(x.split()), -len(x))
-        )
-
-        if m := self.inString(string, collection_words):
-            for match in m:
-                for translation, words in collection.items():
-                    if match in words:
-                        string = self.replaceInString(string, match, translation)
-                        break
+        for match in collection.pattern.findall(string):
+            string = self.replaceInString(
+                string, match, collection.translations[match]
+            )
         return string
 
-    def _flatten(self, lst: list[str | list]) -> list[str]:
-        """Flatten a list of strings and lists into a single list of strings."""
-        flattened = []
-        for item in lst:
-            if isinstance(item, list):
-                flattened.extend(self._flatten(item))
-            else:
-                flattened.append(item)
-        return list(filter(None, flattened))
-
     def _unpack_compound_words(self, string: str) -> str:
         """Unpack compound words in a string."""
-
-        def get_params(fragment: str) -> list[str]:
-            params = re.findall(r"\{(.*?)\}", fragment)
-            return params if params else []
-
-        compounds: dict[str, str] | None = self.lang.get(LangPackKeys.COMPOUND_WORDS)
-        if not compounds:
-            return string
-
-        for compound, template in compounds.items():
-            if "{" in compound and "}" in compound:
-                # It's a template with parameters, build search regex
-                params = get_params(compound)
-                pattern = re.escape(compound)
-                for param in params:
-                    if ":" in param:
-                        # TODO: Use langpack enum to allow any of these types
-                        p_name, p_type = param.split(":", 1)
-                        values = ""
-                        if p_type == "numbers":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.NUMBERS, {}).values()
-                            )
-
-                        elif p_type == "days":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.DAYS, {}).values()
-                            )
-
-                        elif p_type == "time_of_day":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.TIME_OF_DAY, {}).values()
-                            )
-
-                        if values:
-                            pattern = pattern.replace(
-                                r"\{" + param + r"\}",
-                                r"(?P<" + p_name + r">" + "|".join(values) + r")",
-                            )
-                    else:
-                        pattern = pattern.replace(
-                            r"\{" + param + r"\}", r"(?P<" + param + r">\S+)"
+        for compound in self.pack.compounds:
+            # Replace matches by group name in template
+            for match in compound.pattern.finditer(string):
+                replacement = compound.template
+                for param in compound.params:
+                    if param in match.groupdict():
+                        replacement = replacement.replace(
+                            "{" + param + "}", match.group(param)
                         )
-                pattern = r"(?:^|\b)" + pattern + r"(?:\b|$)"
-
-                # Replace matches by group name in template
-                if matches := re.finditer(pattern, string):
-                    for match in matches:
-                        replacement = template
-                        for param in params:
-                            if ":" in param:
-                                param = param.split(":", 1)[0]
-                            if param in match.groupdict():
-                                replacement = replacement.replace(
-                                    "{" + param + "}", match.group(param)
-                                )
-                        string = re.sub(pattern, f" {replacement} ", string, count=1)
+                string = compound.pattern.sub(f" {replacement} ", string, count=1)
         return string
 
     async def translate(
@@ -300,36 +280,24 @@ class TimeSentenceTranslator:
     ) -> str:
         """Load translation file and translate sentence."""
         locale = self._two_char_locale(locale)
-        if not self.load_language_pack or self.loaded_lang != locale:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, locale
-            )
-            if not result:
-                return sentence
+        if not await self.async_load_language_pack(locale):
+            return sentence
+        return self.translate_sentence(sentence, clean_untranslated)
 
+    def translate_sentence(self, sentence: str, clean_untranslated: bool = False) -> str:
+        """Translate sentence with the loaded language pack."""
         # Preprocess sentence to ensure structure
         s = self.clean_sentence(sentence)
 
         # Perform any direct translations first
         s = self._unpack_compound_words(s)
 
-        # Convert basic numbers
-        s = self._translate_collection(s, LangPackKeys.NUMBERS)
-
-        collections = [
-            LangPackKeys.TIME_OF_DAY,
-            LangPackKeys.DAYS,
-            LangPackKeys.FRACTIONS,
-            LangPackKeys.DURATIONS,
-            LangPackKeys.OPERATORS,
-            LangPackKeys.NUMBERS,
-            LangPackKeys.OTHER_WORDS,
-            LangPackKeys.DIRECT_TRANSLATIONS,
-        ]
+        # Convert number words to digits in a single pass
+        s = self.pack.numbers.to_digits(s)
 
         _LOGGER.debug("Translating sentence: %s", s)
 
-        for col in collections:
+        for col in TRANSLATION_COLLECTIONS:
             s = self._translate_collection(s, col)
 
         if clean_untranslated:
@@ -362,12 +330,8 @@ class TimeSentenceTranslator:
     ) -> str | None:
         """Translate a response sentence id with optional params."""
         language = self._two_char_locale(locale)
-        if not self.loaded_lang or self.loaded_lang != language:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, language
-            )
-            if not result:
-                return None
+        if not await self.async_load_language_pack(language):
+            return None
 
         responses: dict[str, str] | None = self.lang.get("responses")
         if not responses:
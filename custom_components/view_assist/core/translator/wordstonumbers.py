@@ -1,6 +1,14 @@
-"""Convert time words to numbers."""
+"""Convert time words to numbers.
 
-import re
+Sentences are tokenised once and runs of number words are combined by a small
+state machine, so "twenty one" -> 21, "one hundred and five" -> 105 and bare
+units/teens/tens are converted as they are found.  A language pack numbers
+collection can be supplied to convert non english number words directly.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
 
 numbers = {
     "zero": "0",
@@ -37,37 +45,192 @@ numbers = {
     "billion": "1000000000",
 }
 
+HUNDRED = 100
+THOUSAND = 1000
+
+
+class _NumberPhrase:
+    """State machine to combine consecutive number words into one value."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.total = 0
+        self.hundreds = 0
+        self.small = 0
+        self.last_scale: int | None = None
+        self.after_scale = False
+        self.closed = False
+        self.empty = True
+
+    @property
+    def value(self) -> int:
+        """Return value of phrase."""
+        return self.total + self.hundreds * HUNDRED + self.small
+
+    def _small_is_tens(self) -> bool:
+        """Return if small part is a whole tens value (20, 30...90)."""
+        return 20 <= self.small < HUNDRED and self.small % 10 == 0
+
+    def can_join(self, value: int) -> bool:
+        """Return if a joiner word (ie and) can link this phrase to value."""
+        if self.closed or self.empty:
+            return False
+        if self.after_scale and value < HUNDRED:
+            return True
+        return self._small_is_tens() and 1 <= value <= 9
+
+    def add(self, value: int) -> bool:
+        """Add a number word value.  Returns False if it starts a new number."""
+        if self.closed:
+            return False
+
+        if self.empty:
+            self.empty = False
+            if value == 0:
+                self.closed = True
+            elif value == HUNDRED:
+                self.hundreds = 1
+                self.after_scale = True
+            elif value >= THOUSAND:
+                self.total = value
+                self.last_scale = value
+                self.after_scale = True
+            else:
+                self.small = value
+            return True
+
+        if value == 0:
+            return False
+
+        if value == HUNDRED:
+            if self.hundreds or not 0 < self.small < HUNDRED:
+                return False
+            self.hundreds = self.small
+            self.small = 0
+            self.after_scale = True
+            return True
+
+        if value >= THOUSAND:
+            if self.last_scale is not None and value >= self.last_scale:
+                return False
+            self.total += ((self.hundreds * HUNDRED + self.small) or 1) * value
+            self.hundreds = self.small = 0
+            self.last_scale = value
+            self.after_scale = True
+            return True
+
+        if self.small == 0 and self.after_scale:
+            self.small = value
+            self.after_scale = False
+            return True
+
+        if self._small_is_tens() and 1 <= value <= 9:
+            self.small += value
+            return True
+
+        return False
+
 
 class WordsToDigits:
     """Convert number words to digits in a string."""
 
+    def __init__(
+        self,
+        vocabulary: dict[str, str | list[str]] | None = None,
+        joiners: list[str] | None = None,
+    ) -> None:
+        """Initialise converter.
+
+        vocabulary is a language pack numbers collection (english number
+        word: local word(s)).  If not supplied, english number words are used.
+        """
+        self.phrases: dict[tuple[str, ...], int] = {}
+        self.max_phrase_length = 1
+
+        if vocabulary is None:
+            for word, value in numbers.items():
+                self._add_phrase(word, int(value))
+            if joiners is None:
+                joiners = ["and"]
+        else:
+            english = english_converter()
+            for english_words, local_words in vocabulary.items():
+                value = english.parse(english_words)
+                if value is None:
+                    continue
+                if isinstance(local_words, str):
+                    local_words = [local_words]
+                for local_word in local_words:
+                    if local_word:
+                        self._add_phrase(local_word, value)
+
+        self.joiners = frozenset(j.lower() for j in joiners or [] if j)
+
+    def _add_phrase(self, phrase: str, value: int) -> None:
+        """Add number phrase to lookup table."""
+        tokens = tuple(phrase.lower().split())
+        if tokens:
+            self.phrases[tokens] = value
+            self.max_phrase_length = max(self.max_phrase_length, len(tokens))
+
+    def _match(self, tokens: list[str], idx: int) -> tuple[int, int] | None:
+        """Get longest number phrase at token index as (value, length)."""
+        for length in range(min(self.max_phrase_length, len(tokens) - idx), 0, -1):
+            value = self.phrases.get(tuple(tokens[idx : idx + length]))
+            if value is not None:
+                return value, length
+        return None
+
+    def to_digits(self, s: str) -> str:
+        """Convert number words in a string to digits."""
+        tokens = s.lower().split()
+        output: list[str] = []
+        phrase: _NumberPhrase | None = None
+
+        idx = 0
+        while idx < len(tokens):
+            if match := self._match(tokens, idx):
+                value, length = match
+                if phrase is None or not phrase.add(value):
+                    if phrase is not None:
+                        output.append(str(phrase.value))
+                    phrase = _NumberPhrase()
+                    phrase.add(value)
+                idx += length
+                continue
+
+            # Joiner words like 'and' in 'one hundred and five'
+            if phrase is not None and tokens[idx] in self.joiners:
+                if (match := self._match(tokens, idx + 1)) and phrase.can_join(
+                    match[0]
+                ):
+                    phrase.add(match[0])
+                    idx += 1 + match[1]
+                    continue
+
+            if phrase is not None:
+                output.append(str(phrase.value))
+                phrase = None
+            output.append(tokens[idx])
+            idx += 1
+
+        if phrase is not None:
+            output.append(str(phrase.value))
+
+        return " ".join(output)
+
+    def parse(self, s: str) -> int | None:
+        """Parse a string that is only a number phrase to an int."""
+        converted = self.to_digits(s)
+        return int(converted) if converted.isdigit() else None
+
     @staticmethod
     def convert(s: str, number_joiner: str | None = None) -> str:
-        """Convert number words to digits in a string."""
-        s = s.lower()
-
-        # Handle "twenty one", "thirty two", etc.
-        tens = "twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety"
-
-        units = "one|two|three|four|five|six|seven|eight|nine"
-
-        word_pattern = rf"(?:^|\s)({tens}) ({units})(?:$|\s)"
-        if matches := re.findall(word_pattern, s):
-            for m in matches:
-                p = rf"(?:^|\s)({m[0]}) ({m[1]})(?:$|\s)"
-                s = re.sub(
-                    p,
-                    " " + str(int(numbers[m[0]]) + int(numbers[m[1]])) + " ",
-                    s,
-                )
-
-        all_numbers = "|".join(numbers.keys())
-        word_pattern = rf"({all_numbers})\b"
-        if m := re.findall(word_pattern, s):
-            for group in m:
-                word_p = rf"(?:^|\s)({group})(?:$|\s)"
-                s = re.sub(word_p, " " + numbers[group] + " ", s)
-
-        # Clean up spaces
-        s = re.sub(r"\s+", " ", s)
-        return s.strip()
+        """Convert english number words to digits in a string."""
+        return english_converter(number_joiner or "and").to_digits(s)
+
+
+@lru_cache(maxsize=4)
+def english_converter(number_joiner: str = "and") -> WordsToDigits:
+    """Get compiled english number words converter."""
+    return WordsToDigits(joiners=[number_joiner])
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import StrEnum
+from functools import cached_property
 import logging
 import time
 from typing import Any
@@ -9,17 +15,30 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components.websocket_api import (
+    ERR_NOT_FOUND,
     ActiveConnection,
     async_register_command,
     async_response,
-    event_message,
     websocket_command,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_interval,
+)
+from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.start import async_at_started
 
 from ..const import DOMAIN  # noqa: TID252
 from ..devices.menu import MenuManager  # noqa: TID252
@@ -27,9 +46,11 @@ from ..helpers import (  # noqa: TID252
     get_config_entry_by_entity_id,
     get_device_id_from_entity_id,
     get_entity_id_by_browser_id,
+    get_integration_entries,
     get_mimic_entity_id,
 )
 from ..typed import VAConfigEntry, VAEvent, VAEventType, VAScreenMode  # noqa: TID252
+from .overlays import OverlayRegistry
 from .timers import TimerManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +58,200 @@ _LOGGER = logging.getLogger(__name__)
 BROWSER_IDS = "browser_ids"
 WEBSOCKET_MANAGER = "websocket_manager"
 WEBSOCKET_EVENTS = [VAEventType.ASSIST_LISTENING, VAEventType.NAVIGATION]
+CONFIG_PATCH_EVENT = "config_patch"
+CONFIG_EVENTS = [
+    VAEventType.CONFIG_UPDATE,
+    VAEventType.BROWSER_REGISTERED,
+    VAEventType.BROWSER_UNREGISTERED,
+]
+SEND_EVENTS = [
+    VAEventType.BROWSER_REGISTERED,
+    VAEventType.BROWSER_UNREGISTERED,
+    VAEventType.CONFIG_UPDATE,
+    VAEventType.ASSIST_LISTENING,
+    VAEventType.NAVIGATION,
+    VAEventType.TIMER_UPDATE,
+    VAEventType.RELOAD,
+    VAEventType.TIME_SYNC,
+]
+# Events sent only if a browser subscribes to them, default all
+OPTIONAL_EVENTS = [
+    VAEventType.ASSIST_LISTENING,
+    VAEventType.NAVIGATION,
+    VAEventType.TIMER_UPDATE,
+]
+# Events sent on the global rather than device dispatcher signal
+GLOBAL_EVENTS = [VAEventType.TIMER_UPDATE]
+# Optional config payload sections and their keys, default all
+PAYLOAD_SECTIONS = {
+    "timers": ["timers"],
+    "menu": ["menu"],
+    "navigation": ["home", "dashboard", "music", "intent"],
+}
+# Connections started per batch once devices are ready, and time between batches
+ADMISSION_BATCH_SIZE = 10
+ADMISSION_INTERVAL = 0.25
+# Max time after HA start to wait for devices to load
+ADMISSION_MAX_WAIT = 30
+# Interval to check for HA clock changes and change that browsers resync on
+CLOCK_CHECK_INTERVAL = timedelta(minutes=1)
+CLOCK_JUMP_THRESHOLD = 0.5
+# Max outbox coalescing window a browser can request
+MAX_COALESCE_WINDOW_MS = 1000
+# Unacked events before a browser is treated as stalled
+MAX_IN_FLIGHT = 20
+# Max events queued for a browser
+MAX_QUEUED_EVENTS = 50
+
+
+class EventPriority(StrEnum):
+    """How queued events are handled."""
+
+    # Always sent, in order
+    MUST_DELIVER = "must_deliver"
+    # Only the latest is sent if queued while the browser is stalled
+    LATEST_WINS = "latest_wins"
+    # Only the latest is sent, in place of the first queued
+    COLLAPSIBLE = "collapsible"
+
+
+EVENT_PRIORITIES = {
+    VAEventType.ASSIST_LISTENING: EventPriority.LATEST_WINS,
+    VAEventType.NAVIGATION: EventPriority.LATEST_WINS,
+    VAEventType.CONFIG_UPDATE: EventPriority.COLLAPSIBLE,
+    VAEventType.TIMER_UPDATE: EventPriority.COLLAPSIBLE,
+    VAEventType.TIME_SYNC: EventPriority.COLLAPSIBLE,
+}
+
+
+@dataclass
+class ConnectionOptions:
+    """Options declared by a browser on connect."""
+
+    # Send config updates as patches
+    delta: bool = False
+    # Time to collect events before sending.  0 is within one loop iteration
+    coalesce_window: float = 0
+    # Browser acks events, so a stalled browser can be detected
+    flow_control: bool = False
+    # Optional events and config payload sections to send
+    events: frozenset[str] = frozenset(OPTIONAL_EVENTS)
+    sections: frozenset[str] = frozenset(PAYLOAD_SECTIONS)
+
+
+@dataclass
+class TimingStats:
+    """Count and timing stats."""
+
+    count: int = 0
+    total_ms: float = 0
+    max_ms: float = 0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record a timing."""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return stats as dict."""
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+@dataclass
+class ChannelStats:
+    """Websocket channel stats for a browser or config entry."""
+
+    messages: dict[str, int] = field(default_factory=dict)
+    bytes: dict[str, int] = field(default_factory=dict)
+    # Time from dispatcher signal to send
+    latency: TimingStats = field(default_factory=TimingStats)
+    # Config payload build time
+    build: TimingStats = field(default_factory=TimingStats)
+    dropped: dict[str, int] = field(default_factory=dict)
+    connects: int = 0
+    disconnects: int = 0
+    replaced: int = 0
+
+    def record_send(self, event_name: str, size: int, latency_ms: float) -> None:
+        """Record a sent message."""
+        self.messages[event_name] = self.messages.get(event_name, 0) + 1
+        self.bytes[event_name] = self.bytes.get(event_name, 0) + size
+        self.latency.record(latency_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return stats as dict."""
+        return {
+            "messages": sum(self.messages.values()),
+            "bytes": sum(self.bytes.values()),
+            "messages_by_event": self.messages,
+            "bytes_by_event": self.bytes,
+            "latency": self.latency.as_dict(),
+            "build": self.build.as_dict(),
+            "dropped": self.dropped,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "replaced": self.replaced,
+        }
+
+
+def _escape_pointer(key: str) -> str:
+    """Escape a key for a json pointer path."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def make_json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Make RFC 6902 operations to change old into new.
+
+    Dicts are patched by key.  Lists and other values are replaced whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [
+            {"op": "remove", "path": f"{path}/{_escape_pointer(key)}"}
+            for key in old
+            if key not in new
+        ]
+        for key, value in new.items():
+            key_path = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": key_path, "value": value})
+            else:
+                ops.extend(make_json_patch(old[key], value, key_path))
+        return ops
+
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+@dataclass
+class EventSnapshot:
+    """Config event payload for a config entry, shared by its connections."""
+
+    version: int
+    event: VAEvent | None
+    entity_id: str
+    data: dict[str, Any]
+    sections: frozenset[str] = frozenset(PAYLOAD_SECTIONS)
+    # Serialized patches to this snapshot by base snapshot version
+    patches: dict[int, str] = field(default_factory=dict)
+
+    @cached_property
+    def json(self) -> str:
+        """Get payload serialized to json."""
+        return JSON_DUMP(self.data)
+
+    def get_patch(self, base: EventSnapshot) -> str:
+        """Get serialized patch from a base snapshot to this snapshot."""
+        if base.version not in self.patches:
+            self.patches[base.version] = JSON_DUMP(
+                make_json_patch(base.data, self.data)
+            )
+        return self.patches[base.version]
 
 
 class WebsocketManager:
@@ -56,24 +271,349 @@ class WebsocketManager:
         self.config = config
         self.connections: dict[str, WebsocketListenerHandler] = {}
 
+        # Connections waiting to be started until devices are ready
+        self._admission: deque[WebsocketListenerHandler] = deque()
+        self._admission_task: asyncio.Task | None = None
+        self._ready = False
+        self._cancel_ready_timeout: CALLBACK_TYPE | None = None
+
+        # Channel stats by browser id and config entry id
+        self.browser_stats: dict[str, ChannelStats] = {}
+        self.entry_stats: dict[str, ChannelStats] = {}
+
+        # Wall clock offset from monotonic clock, to detect clock changes
+        self._clock_offset = time.time() - time.monotonic()
+
+        # Config event payloads by entry id
+        self.snapshots: dict[str, EventSnapshot] = {}
+        # Device ids of configured entities by entry id
+        self._device_ids: dict[str, tuple[tuple[str, ...], dict[str, str]]] = {}
+        # Timers by entity id for the last timer event
+        self._timers: tuple[VAEvent | None, dict[str, list]] = (None, {})
+        # Serialized (payload, json) by payload object id for the last event
+        self._serialized: tuple[VAEvent | None, dict[int, tuple[Any, str]]] = (
+            None,
+            {},
+        )
+
     async def async_setup(self) -> bool:
         """Set up the WebsocketManager."""
         # Ensure hass.data structure
         if BROWSER_IDS not in self.hass.data[DOMAIN]:
             self.hass.data[DOMAIN][BROWSER_IDS] = {}
 
+        # Device ids in snapshots are invalidated by entity registry changes
+        self.config.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._entity_registry_updated
+            )
+        )
+
+        # Admit connections once HA has started and devices have loaded
+        self.config.async_on_unload(
+            async_at_started(self.hass, self._async_check_ready)
+        )
+        self.config.async_on_unload(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._config_entry_changed
+            )
+        )
+
+        # Tell browsers to resync time if HA clock changes
+        self.config.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._async_check_clock, CLOCK_CHECK_INTERVAL
+            )
+        )
+
         setup_websocket_commands(self.hass)
         return True
 
+    @callback
+    def _async_check_clock(self, *args) -> None:
+        """Send time sync event to browsers if the clock has changed."""
+        clock_offset = time.time() - time.monotonic()
+        if abs(clock_offset - self._clock_offset) < CLOCK_JUMP_THRESHOLD:
+            return
+        _LOGGER.debug(
+            "Clock changed by %.3fs, resyncing browser time",
+            clock_offset - self._clock_offset,
+        )
+        self._clock_offset = clock_offset
+        for handler in self.connections.values():
+            handler.resync_time()
+
+    @callback
+    def _config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Check if devices are ready on config entry changes."""
+        if entry.domain == DOMAIN:
+            self._async_check_ready()
+
+    @callback
+    def _async_check_ready(self, *args) -> None:
+        """Start admitting connections if HA has started and devices loaded."""
+        if self._ready or not self.hass.is_running:
+            return
+        if any(
+            entry.state
+            in (ConfigEntryState.NOT_LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+            for entry in get_integration_entries(self.hass)
+        ):
+            # Do not wait forever for a device that does not load
+            if self._cancel_ready_timeout is None:
+                self._cancel_ready_timeout = async_call_later(
+                    self.hass, ADMISSION_MAX_WAIT, self._async_ready
+                )
+            return
+        self._async_ready()
+
+    @callback
+    def _async_ready(self, *args) -> None:
+        """Set ready and admit waiting connections."""
+        if self._cancel_ready_timeout:
+            self._cancel_ready_timeout()
+            self._cancel_ready_timeout = None
+        if self._ready:
+            return
+        _LOGGER.debug(
+            "Devices ready, admitting %s waiting connections", len(self._admission)
+        )
+        self._ready = True
+        self._async_admit()
+
+    @callback
+    def _async_admit(self) -> None:
+        """Start admitting queued connections."""
+        if self._ready and self._admission and self._admission_task is None:
+            self._admission_task = self.config.async_create_background_task(
+                self.hass, self._async_admit_connections(), name="VAAdmitConnections"
+            )
+
+    async def _async_admit_connections(self) -> None:
+        """Start queued connections in paced batches.
+
+        Browser ids resolve from the relationship index, so a batch shares
+        one index build and sends its initial snapshots together.
+        """
+        try:
+            while self._admission:
+                for _ in range(min(ADMISSION_BATCH_SIZE, len(self._admission))):
+                    handler = self._admission.popleft()
+                    # Skip if disconnected or replaced while waiting
+                    if self.connections.get(handler.browser_id) is handler:
+                        handler.start()
+                if self._admission:
+                    await asyncio.sleep(ADMISSION_INTERVAL)
+        finally:
+            self._admission_task = None
+
+    @callback
+    def _entity_registry_updated(self, event: Event) -> None:
+        """Clear cached device ids on entity registry changes."""
+        self._device_ids = {}
+
+    def get_event_timers(self, entity_id: str, event: VAEvent) -> list:
+        """Get timers for an entity, shared by connections for a timer event."""
+        if self._timers[0] is not event:
+            self._timers = (event, {})
+        timers = self._timers[1]
+        if entity_id not in timers:
+            timers[entity_id] = []
+            if timer_manager := TimerManager.get(self.hass):
+                timers[entity_id] = timer_manager.get_timers(
+                    entity_id=entity_id, include_expired=True
+                )
+        return timers[entity_id]
+
+    def serialize_event(self, event: VAEvent, payload: Any) -> str:
+        """Serialize an event.
+
+        Serialized once per event and payload and shared by all connections
+        that are sent the same event.
+        """
+        if self._serialized[0] is not event:
+            self._serialized = (event, {})
+        serialized = self._serialized[1]
+        # Payload is held with its json so its id cannot be reused
+        cached = serialized.get(id(payload))
+        if cached is None or cached[0] is not payload:
+            cached = serialized[id(payload)] = (
+                payload,
+                JSON_DUMP({"event": event.event_name, "payload": payload}),
+            )
+        return cached[1]
+
+    def get_event_snapshot(
+        self,
+        config: VAConfigEntry,
+        entity_id: str,
+        event: VAEvent,
+        sections: frozenset[str] = frozenset(PAYLOAD_SECTIONS),
+    ) -> EventSnapshot:
+        """Get config event payload for an entry.
+
+        The payload is built once per config event and shared by all
+        connections for the entry, including mimic connections.  It includes
+        the sections requested by any connection for the entry.
+        """
+        snapshot = self.snapshots.get(config.entry_id)
+        if (
+            snapshot is None
+            or snapshot.event is not event
+            or snapshot.entity_id != entity_id
+            or not sections <= snapshot.sections
+        ):
+            if snapshot is not None:
+                sections |= snapshot.sections
+            start = time.perf_counter()
+            data = self._build_event_data(config, entity_id, sections)
+            self.get_entry_stats(config.entry_id).build.record(
+                (time.perf_counter() - start) * 1000
+            )
+            snapshot = self.snapshots[config.entry_id] = EventSnapshot(
+                version=snapshot.version + 1 if snapshot else 1,
+                event=event,
+                entity_id=entity_id,
+                data=data,
+                sections=sections,
+            )
+        return snapshot
+
+    def get_browser_stats(self, browser_id: str) -> ChannelStats:
+        """Get channel stats for a browser."""
+        return self.browser_stats.setdefault(browser_id, ChannelStats())
+
+    def get_entry_stats(self, entry_id: str) -> ChannelStats:
+        """Get channel stats for a config entry."""
+        return self.entry_stats.setdefault(entry_id, ChannelStats())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return websocket channel stats."""
+        return {
+            "connections": len(self.connections),
+            "waiting_admission": len(self._admission),
+            "browsers": {
+                browser_id: {
+                    "entity_id": handler.entity_id
+                    if (handler := self.connections.get(browser_id))
+                    else None,
+                    **stats.as_dict(),
+                }
+                for browser_id, stats in self.browser_stats.items()
+            },
+            "entries": {
+                entry_id: stats.as_dict()
+                for entry_id, stats in self.entry_stats.items()
+            },
+        }
+
+    def _get_device_ids(
+        self, config: VAConfigEntry, entity_ids: tuple[str, ...]
+    ) -> dict[str, str]:
+        """Get device ids of configured entities."""
+        cached = self._device_ids.get(config.entry_id)
+        if cached is None or cached[0] != entity_ids:
+            cached = self._device_ids[config.entry_id] = (
+                entity_ids,
+                {
+                    entity_id: get_device_id_from_entity_id(self.hass, entity_id)
+                    for entity_id in entity_ids
+                },
+            )
+        return cached[1]
+
+    def _build_event_data(
+        self,
+        config: VAConfigEntry,
+        entity_id: str,
+        sections: frozenset[str] = frozenset(PAYLOAD_SECTIONS),
+    ) -> dict[str, Any]:
+        """Build config event payload for an entry.
+
+        Optional sections not requested are not built.
+        """
+        if config.disabled_by:
+            return {}
+
+        data = config.runtime_data
+        timer_info = {}
+        if "timers" in sections and (timers := TimerManager.get(self.hass)):
+            timer_info = timers.get_timers(entity_id=entity_id, include_expired=True)
+
+        menu_info = {}
+        if "menu" in sections and (
+            menu_manager := MenuManager.get(self.hass, config)
+        ):
+            menu_info["status_icons"] = menu_manager.status_icons.copy()
+            menu_info["menu_items"] = menu_manager.menu_items.copy()
+            menu_info["menu_active"] = menu_manager.active
+            menu_info["menu_config"] = data.dashboard.display_settings.menu_config
+
+        try:
+            device_ids = self._get_device_ids(
+                config,
+                (
+                    data.core.mic_device,
+                    data.core.mediaplayer_device,
+                    data.core.musicplayer_device,
+                ),
+            )
+            payload = {
+                "entity_id": entity_id,
+                "name": data.core.name,
+                "mic_entity_id": data.core.mic_device,
+                "mic_device_id": device_ids[data.core.mic_device],
+                "mediaplayer_entity_id": data.core.mediaplayer_device,
+                "mediaplayer_device_id": device_ids[data.core.mediaplayer_device],
+                "musicplayer_entity_id": data.core.musicplayer_device,
+                "musicplayer_device_id": device_ids[data.core.musicplayer_device],
+                "display_device_id": data.core.display_device,
+                "menu": menu_info,
+                "timers": timer_info,
+                "background": data.dashboard.background_settings.background,
+                "dashboard": data.dashboard.dashboard,
+                "home": data.dashboard.home
+                if not data.runtime_config_overrides.home
+                else data.runtime_config_overrides.home,
+                "music": data.dashboard.music,
+                "intent": data.dashboard.intent,
+                "hide_sidebar": data.dashboard.display_settings.screen_mode
+                in [
+                    VAScreenMode.HIDE_HEADER_SIDEBAR,
+                    VAScreenMode.HIDE_SIDEBAR,
+                ],
+                "hide_header": data.dashboard.display_settings.screen_mode
+                in [VAScreenMode.HIDE_HEADER_SIDEBAR, VAScreenMode.HIDE_HEADER],
+            }
+        except Exception:  # noqa: BLE001
+            return {}
+
+        for section, keys in PAYLOAD_SECTIONS.items():
+            if section not in sections:
+                for key in keys:
+                    del payload[key]
+        return payload
+
     async def async_unload(self) -> bool:
         """Stop the WebsocketManager."""
         for browser_id in list(self.connections.keys()):
             self.unregister_connection(browser_id, unloading=True)
         self.hass.data[DOMAIN].pop(BROWSER_IDS, None)
+        self.snapshots = {}
+        self._admission.clear()
+        if self._cancel_ready_timeout:
+            self._cancel_ready_timeout()
+            self._cancel_ready_timeout = None
         return True
 
     async def async_register_connection(
-        self, browser_id: str, connection: ActiveConnection, msg_id: int | None = None
+        self,
+        browser_id: str,
+        connection: ActiveConnection,
+        msg_id: int | None = None,
+        options: ConnectionOptions | None = None,
     ):
         """Register a new connection."""
 
@@ -85,19 +625,40 @@ class WebsocketManager:
             self.hass.data[DOMAIN][BROWSER_IDS][browser_id] = browser_id
 
         # Register handler for connection
-        handler = WebsocketListenerHandler(self.hass, connection, browser_id, msg_id)
+        stats = self.get_browser_stats(browser_id)
+        stats.connects += 1
+        handler = WebsocketListenerHandler(
+            self.hass, connection, browser_id, msg_id, options, stats
+        )
 
         # If duplicate connection, stop old one
         if browser_id in self.connections:
+            stats.replaced += 1
             self.connections[browser_id].stop()
 
         self.connections[browser_id] = handler
-        handler.start()
+
+        # Queue if devices are still loading or connections are being admitted
+        if self._ready and not self._admission:
+            handler.start()
+        else:
+            self._admission.append(handler)
+            self._async_admit()
+
+    def get_connection_handler(
+        self, browser_id: str, connection: ActiveConnection
+    ) -> WebsocketListenerHandler | None:
+        """Get handler for a browser id, if registered by this connection."""
+        handler = self.connections.get(browser_id)
+        if handler is not None and handler.connection is connection:
+            return handler
+        return None
 
     def unregister_connection(self, browser_id: str, unloading: bool = False):
         """Unregister a connection."""
         if browser_id in self.connections:
             _LOGGER.debug("Tearing down connection for %s", browser_id)
+            self.get_browser_stats(browser_id).disconnects += 1
             self.connections[browser_id].stop(unloading=unloading)
             del self.connections[browser_id]
 
@@ -115,12 +676,34 @@ class WebsocketListenerHandler:
         connection: ActiveConnection,
         browser_id: str,
         msg_id: int | None = None,
+        options: ConnectionOptions | None = None,
+        stats: ChannelStats | None = None,
     ) -> None:
         """Initialize the WebsocketListenerHandler."""
         self.hass = hass
         self.connection = connection
         self.browser_id = browser_id
         self.msg_id = msg_id
+        self.options = options or ConnectionOptions()
+        self.send_events = {
+            event
+            for event in SEND_EVENTS
+            if event not in OPTIONAL_EVENTS or event in self.options.events
+        }
+
+        # Last config snapshot sent, to send patches from
+        self.sent_snapshot: EventSnapshot | None = None
+
+        self.stats = stats or ChannelStats()
+
+        # Events waiting to be sent, with time queued
+        self._outbox: list[tuple[VAEvent, float]] = []
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+        # Flow control
+        self._sent_seq = 0
+        self._acked_seq = 0
+        self._needs_resync = False
 
         self.config: VAConfigEntry | None = None
         self.entity_id: str | None = None
@@ -133,7 +716,10 @@ class WebsocketListenerHandler:
         if self.entity_id:
             self.config = get_config_entry_by_entity_id(self.hass, self.entity_id)
 
-            if "global" not in self.listeners:
+            # Only global events are timer updates
+            if "global" not in self.listeners and self.send_events.intersection(
+                GLOBAL_EVENTS
+            ):
                 self.listeners["global"] = async_dispatcher_connect(
                     self.hass, f"{DOMAIN}_event", self._send_event
                 )
@@ -169,6 +755,9 @@ class WebsocketListenerHandler:
             self._send_event(
                 VAEvent(VAEventType.RELOAD),
             )
+            self._flush(force=True)
+        else:
+            self._cancel_pending()
         for unsub_listener in self.listeners.values():
             unsub_listener()
         self.listeners = {}
@@ -199,37 +788,110 @@ class WebsocketListenerHandler:
 
     @callback
     def _send_event(self, event: VAEvent):
-        """Send event to connection."""
-
-        # Send timers if timer event
-        if event.event_name == VAEventType.TIMER_UPDATE:
-            if timers := TimerManager.get(self.hass):
-                event.payload = timers.get_timers(
-                    entity_id=self.entity_id, include_expired=True
-                )
-
-        # Add config data to event
-        if event.event_name in [
-            VAEventType.CONFIG_UPDATE,
-            VAEventType.BROWSER_REGISTERED,
-            VAEventType.BROWSER_UNREGISTERED,
-        ]:
-            event.payload = self._get_event_data()
+        """Queue event to send to connection."""
 
         # Don't send reload event to mimic device
         if event.event_name == VAEventType.RELOAD and self.mimic:
             return
 
         # Filter event types
-        if event.event_name in [
-            VAEventType.BROWSER_REGISTERED,
-            VAEventType.BROWSER_UNREGISTERED,
-            VAEventType.CONFIG_UPDATE,
-            VAEventType.ASSIST_LISTENING,
-            VAEventType.NAVIGATION,
-            VAEventType.TIMER_UPDATE,
-            VAEventType.RELOAD,
-        ]:
+        if event.event_name not in self.send_events:
+            return
+
+        priority = EVENT_PRIORITIES.get(event.event_name, EventPriority.MUST_DELIVER)
+        queued = next(
+            (
+                idx
+                for idx, (queued_event, _) in enumerate(self._outbox)
+                if queued_event.event_name == event.event_name
+            ),
+            None,
+        )
+        if queued is not None:
+            # Collapse into the queued event, keeping its place and queued time
+            # but sending the latest data
+            if priority == EventPriority.COLLAPSIBLE:
+                self._outbox[queued] = (event, self._outbox[queued][1])
+                return
+            # Replace the queued event if the browser is not keeping up
+            if priority == EventPriority.LATEST_WINS and self.stalled:
+                self._drop(self._outbox.pop(queued)[0])
+            # Browser reloads anyway
+            elif event.event_name == VAEventType.RELOAD:
+                return
+
+        self._outbox.append((event, time.perf_counter()))
+
+        # Drop oldest event if queue is full and resync once browser catches up
+        if len(self._outbox) > MAX_QUEUED_EVENTS:
+            for idx, (queued_event, _) in enumerate(self._outbox):
+                if queued_event.event_name != VAEventType.RELOAD:
+                    self._drop(self._outbox.pop(idx)[0])
+                    self._needs_resync = True
+                    break
+
+        self._schedule_flush()
+
+    @property
+    def stalled(self) -> bool:
+        """Return if the browser has too many unacked events."""
+        return (
+            self.options.flow_control
+            and self._sent_seq - self._acked_seq >= MAX_IN_FLIGHT
+        )
+
+    def _drop(self, event: VAEvent) -> None:
+        """Count a dropped event."""
+        dropped = self.stats.dropped
+        dropped[event.event_name] = dropped.get(event.event_name, 0) + 1
+        _LOGGER.debug(
+            "Dropped %s event for %s - browser not keeping up",
+            event.event_name,
+            self.browser_id,
+        )
+
+    def _schedule_flush(self) -> None:
+        """Schedule sending of queued events."""
+        if self._cancel_flush is not None or not self._outbox or self.stalled:
+            return
+        if self.options.coalesce_window:
+            self._cancel_flush = async_call_later(
+                self.hass, self.options.coalesce_window, self._flush
+            )
+        else:
+            self._cancel_flush = self.hass.loop.call_soon(self._flush).cancel
+
+    @callback
+    def ack(self, seq: int) -> None:
+        """Handle browser ack of events up to seq."""
+        self._acked_seq = max(self._acked_seq, min(seq, self._sent_seq))
+        if self._needs_resync and self._acked_seq == self._sent_seq:
+            _LOGGER.debug("Resyncing %s after dropped events", self.browser_id)
+            self._needs_resync = False
+            self.resync()
+        self._schedule_flush()
+
+    def _cancel_pending(self) -> None:
+        """Cancel sending of queued events."""
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._outbox = []
+
+    @callback
+    def _flush(self, *args, force: bool = False) -> None:
+        """Send queued events.
+
+        Events are sent together so HA can write them to the connection as a
+        single coalesced frame.  Sending stops if the browser stalls, unless
+        forced.
+        """
+        # Cancel scheduled flush if called directly
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        while self._outbox and (force or not self.stalled):
+            event, queued_at = self._outbox.pop(0)
             _LOGGER.debug(
                 "Sending event: %s to %s - %s",
                 event.event_name,
@@ -237,83 +899,113 @@ class WebsocketListenerHandler:
                 self.entity_id if not self.mimic else f"{self.entity_id}(mimic)",
             )
 
-            self.connection.send_message(
-                event_message(
-                    self.msg_id, {"event": event.event_name, "payload": event.payload}
+            try:
+                message = self._make_event_message(event)
+            except (TypeError, ValueError) as ex:
+                _LOGGER.error("Unable to serialize %s event: %s", event.event_name, ex)
+                continue
+            self._sent_seq += 1
+            self.connection.send_message(message)
+            self._record_send(event, message, queued_at)
+
+        # Without flow control there are no acks, so resync once queue is sent
+        if self._needs_resync and not self.options.flow_control and not self._outbox:
+            _LOGGER.debug("Resyncing %s after dropped events", self.browser_id)
+            self._needs_resync = False
+            self.resync()
+
+    def _record_send(self, event: VAEvent, message: str, queued_at: float) -> None:
+        """Record sent message in browser and config entry stats."""
+        size = len(message.encode())
+        latency_ms = (time.perf_counter() - queued_at) * 1000
+        self.stats.record_send(event.event_name, size, latency_ms)
+        if self.config:
+            WebsocketManager.get(self.hass).get_entry_stats(
+                self.config.entry_id
+            ).record_send(event.event_name, size, latency_ms)
+
+    def resync(self) -> None:
+        """Send full config to the connection."""
+        self.sent_snapshot = None
+        if self.entity_id:
+            self._send_event(VAEvent(VAEventType.CONFIG_UPDATE))
+
+    def resync_time(self) -> None:
+        """Tell the browser to resync its time with the server."""
+        self._send_event(VAEvent(VAEventType.TIME_SYNC))
+
+    def _make_event_message(self, event: VAEvent) -> str:
+        """Make a pre-serialized event message for this connection.
+
+        Payloads are serialized once and shared by all connections.  Only the
+        message id, and browser id and mimic flag of config events are added
+        per connection.
+        """
+        if event.event_name in CONFIG_EVENTS:
+            snapshot = self._get_event_data(event)
+            if not snapshot or not snapshot.data:
+                self.sent_snapshot = None
+                event_json = f'{{"event":{JSON_DUMP(event.event_name)},"payload":{{}}}}'
+            elif (patch := self._get_patch(event, snapshot)) is not None:
+                event_json = (
+                    f'{{"event":"{CONFIG_PATCH_EVENT}","payload":{{'
+                    f'"base":{self.sent_snapshot.version},'
+                    f'"revision":{snapshot.version},"patch":{patch}}}}}'
+                )
+            else:
+                payload = (
+                    f'{{"browser_id":{JSON_DUMP(self.browser_id)},'
+                    f'"mimic_device":{JSON_DUMP(self.mimic)},{snapshot.json[1:]}'
+                )
+                event_json = (
+                    f'{{"event":{JSON_DUMP(event.event_name)},"payload":{payload},'
+                    f'"revision":{snapshot.version}}}'
                 )
+            if snapshot and snapshot.data:
+                self.sent_snapshot = snapshot
+        else:
+            payload = event.payload
+            # Send timers for this entity if timer event
+            if event.event_name == VAEventType.TIMER_UPDATE and TimerManager.get(
+                self.hass
+            ):
+                payload = WebsocketManager.get(self.hass).get_event_timers(
+                    self.entity_id, event
+                )
+            event_json = WebsocketManager.get(self.hass).serialize_event(
+                event, payload
             )
+        if self.options.flow_control:
+            # Add sequence number for browser to ack
+            event_json = f'{event_json[:-1]},"seq":{self._sent_seq + 1}}}'
+        return f'{{"id":{JSON_DUMP(self.msg_id)},"type":"event","event":{event_json}}}'
 
-    def _get_event_data(self) -> dict[str, Any]:
-        output = {}
+    def _get_patch(self, event: VAEvent, snapshot: EventSnapshot) -> str | None:
+        """Get serialized patch from the last sent snapshot if smaller than full."""
+        if (
+            not self.options.delta
+            or event.event_name != VAEventType.CONFIG_UPDATE
+            or self.sent_snapshot is None
+            or self.sent_snapshot.entity_id != snapshot.entity_id
+        ):
+            return None
+        patch = snapshot.get_patch(self.sent_snapshot)
+        return patch if len(patch) < len(snapshot.json) else None
+
+    def _get_event_data(self, event: VAEvent) -> EventSnapshot | None:
+        """Get config event data from the shared entry snapshot."""
         config = self.config
 
         # Use mimic'd entity config if mimic device
         if self.mimic:
             config = get_config_entry_by_entity_id(self.hass, self.entity_id)
 
-        if self.entity_id and config:
-            if config.disabled_by:
-                return output
-
-            data = config.runtime_data
-            timer_info = {}
-            if timers := TimerManager.get(self.hass):
-                timer_info = timers.get_timers(
-                    entity_id=self.entity_id, include_expired=True
-                )
-
-            menu_info = {}
-            if menu_manager := MenuManager.get(self.hass, config):
-                menu_info["status_icons"] = (
-                    menu_manager.status_icons.copy() if menu_manager else []
-                )
-                menu_info["menu_items"] = (
-                    menu_manager.menu_items.copy() if menu_manager else []
-                )
-                menu_info["menu_active"] = (
-                    menu_manager.active if menu_manager else False
-                )
-                menu_info["menu_config"] = data.dashboard.display_settings.menu_config
+        if not self.entity_id or not config:
+            return None
 
-            try:
-                output = {
-                    "browser_id": self.browser_id,
-                    "entity_id": self.entity_id,
-                    "mimic_device": self.mimic,
-                    "name": data.core.name,
-                    "mic_entity_id": data.core.mic_device,
-                    "mic_device_id": get_device_id_from_entity_id(
-                        self.hass, data.core.mic_device
-                    ),
-                    "mediaplayer_entity_id": data.core.mediaplayer_device,
-                    "mediaplayer_device_id": get_device_id_from_entity_id(
-                        self.hass, data.core.mediaplayer_device
-                    ),
-                    "musicplayer_entity_id": data.core.musicplayer_device,
-                    "musicplayer_device_id": get_device_id_from_entity_id(
-                        self.hass, data.core.musicplayer_device
-                    ),
-                    "display_device_id": data.core.display_device,
-                    "menu": menu_info,
-                    "timers": timer_info,
-                    "background": data.dashboard.background_settings.background,
-                    "dashboard": data.dashboard.dashboard,
-                    "home": data.dashboard.home
-                    if not data.runtime_config_overrides.home
-                    else data.runtime_config_overrides.home,
-                    "music": data.dashboard.music,
-                    "intent": data.dashboard.intent,
-                    "hide_sidebar": data.dashboard.display_settings.screen_mode
-                    in [
-                        VAScreenMode.HIDE_HEADER_SIDEBAR,
-                        VAScreenMode.HIDE_SIDEBAR,
-                    ],
-                    "hide_header": data.dashboard.display_settings.screen_mode
-                    in [VAScreenMode.HIDE_HEADER_SIDEBAR, VAScreenMode.HIDE_HEADER],
-                }
-            except Exception:  # noqa: BLE001
-                output = {}
-        return output
+        return WebsocketManager.get(self.hass).get_event_snapshot(
+            config, self.entity_id, event, self.options.sections
+        )
 
 
 def setup_websocket_commands(hass: HomeAssistant) -> None:
@@ -323,6 +1015,15 @@ def setup_websocket_commands(hass: HomeAssistant) -> None:
         {
             vol.Required("type"): f"{DOMAIN}/connect",
             vol.Required("browser_id"): str,
+            vol.Optional("delta", default=False): bool,
+            vol.Optional("coalesce_ms", default=0): vol.All(
+                int, vol.Range(min=0, max=MAX_COALESCE_WINDOW_MS)
+            ),
+            vol.Optional("flow_control", default=False): bool,
+            vol.Optional("events", default=OPTIONAL_EVENTS): [vol.In(OPTIONAL_EVENTS)],
+            vol.Optional("sections", default=list(PAYLOAD_SECTIONS)): [
+                vol.In(PAYLOAD_SECTIONS)
+            ],
         }
     )
     @async_response
@@ -340,7 +1041,16 @@ def setup_websocket_commands(hass: HomeAssistant) -> None:
 
         # Register browser
         await WebsocketManager.get(hass).async_register_connection(
-            browser_id, connection, msg["id"]
+            browser_id,
+            connection,
+            msg["id"],
+            ConnectionOptions(
+                delta=msg["delta"],
+                coalesce_window=msg["coalesce_ms"] / 1000,
+                flow_control=msg["flow_control"],
+                events=frozenset(msg["events"]),
+                sections=frozenset(msg["sections"]),
+            ),
         )
 
         # Register close connection callback
@@ -386,6 +1096,23 @@ def setup_websocket_commands(hass: HomeAssistant) -> None:
         delta = round(time.time() * 1000) - msg["epoch"]
         connection.send_result(msg["id"], delta)
 
+    # Get server timestamps for browser time sync
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/time_sync",
+            vol.Required("t0"): vol.Coerce(float),
+        }
+    )
+    @callback
+    def handle_time_sync(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Get server receive and send times in ms for a browser time sample."""
+        received = time.time() * 1000
+        connection.send_result(
+            msg["id"], {"t0": msg["t0"], "t1": received, "t2": time.time() * 1000}
+        )
+
     # Get timer by name
     @websocket_command(
         {
@@ -411,8 +1138,75 @@ def setup_websocket_commands(hass: HomeAssistant) -> None:
 
         connection.send_result(msg["id"], output)
 
+    # Resync full config after a missed config patch
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/resync",
+            vol.Required("browser_id"): str,
+        }
+    )
+    @callback
+    def handle_resync(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Resend full config to a browser."""
+        if not (
+            handler := WebsocketManager.get(hass).get_connection_handler(
+                msg["browser_id"], connection
+            )
+        ):
+            connection.send_error(
+                msg["id"], ERR_NOT_FOUND, "Browser not connected on this connection"
+            )
+            return
+        handler.resync()
+        connection.send_result(msg["id"])
+
+    # Ack events received by a browser
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/ack",
+            vol.Required("browser_id"): str,
+            vol.Required("seq"): int,
+        }
+    )
+    @callback
+    def handle_ack(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Ack events received by a browser."""
+        if not (
+            handler := WebsocketManager.get(hass).get_connection_handler(
+                msg["browser_id"], connection
+            )
+        ):
+            connection.send_error(
+                msg["id"], ERR_NOT_FOUND, "Browser not connected on this connection"
+            )
+            return
+        handler.ack(msg["seq"])
+        connection.send_result(msg["id"])
+
+    # Get available overlays
+    @websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/get_overlays",
+        }
+    )
+    @async_response
+    async def handle_get_overlays(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        """Get available overlays as id: name."""
+        overlays = await OverlayRegistry.get(hass).async_get_overlays()
+        connection.send_result(msg["id"], overlays)
+
     # Register commands
     async_register_command(hass, handle_connect)
     async_register_command(hass, handle_get_entity_by_browser_id)
     async_register_command(hass, handle_get_server_time)
+    async_register_command(hass, handle_time_sync)
     async_register_command(hass, handle_get_timer_by_name)
+    async_register_command(hass, handle_get_overlays)
+    async_register_command(hass, handle_resync)
+    async_register_command(hass, handle_ack)
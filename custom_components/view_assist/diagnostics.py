@@ -0,0 +1,28 @@
+"""Diagnostics support for View Assist."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import CONF_TYPE
+from homeassistant.core import HomeAssistant
+
+from .core import BlockingIOAuditor, Translator, WebsocketManager
+from .typed import VAConfigEntry, VAType
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: VAConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics: dict[str, Any] = {"type": entry.data.get(CONF_TYPE)}
+
+    if entry.data.get(CONF_TYPE) == VAType.MASTER_CONFIG:
+        if translator := Translator.get(hass):
+            diagnostics["translation"] = translator.get_stats()
+        if auditor := BlockingIOAuditor.get(hass):
+            diagnostics["blocking_io"] = auditor.get_report()
+        if websockets := WebsocketManager.get(hass):
+            diagnostics["websocket"] = websockets.get_stats()
+
+    return diagnostics
@@ -2,11 +2,8 @@
 
 from functools import reduce
 import logging
-from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
-
 from homeassistant.const import CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -14,14 +11,13 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from .const import (
     BROWSERMOD_DOMAIN,
     CONF_DISPLAY_DEVICE,
-    DASHBOARD_DIR,
     DOMAIN,
     HASSMIC_DOMAIN,
-    OVERLAY_FILE_NAME,
     REMOTE_ASSIST_DISPLAY_DOMAIN,
     VAMODE_REVERTS,
     VAMode,
 )
+from .relationships import RelationshipIndex
 from .typed import VAConfigEntry, VADisplayType, VAType, DISPLAY_DEVICE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
@@ -112,6 +108,11 @@ def get_config_entry_by_config_data_value(
     hass: HomeAssistant, value: str
 ) -> VAConfigEntry:
     """Get config entry from a config data param value."""
+    if index := RelationshipIndex.get(hass):
+        if entry_id := index.get_entry_for_config_value(value):
+            return hass.config_entries.async_get_entry(entry_id)
+        return None
+
     # Loop config entries
     for entry in get_integration_entries(hass):
         for param_value in entry.data.values():
@@ -167,6 +168,9 @@ def get_devices_for_domain(hass: HomeAssistant, domain: str) -> list[dr.DeviceEn
 
 def get_mic_device_domain(hass: HomeAssistant, entity_id: str) -> str | None:
     """Get the mic device domain of an entity by id."""
+    if index := RelationshipIndex.get(hass):
+        return index.get_mic_device_domain(entity_id)
+
     entity_registry = er.async_get(hass)
     if va_entity := entity_registry.async_get(entity_id):
         va_entry = hass.config_entries.async_get_entry(va_entity.config_entry_id)
@@ -182,6 +186,9 @@ def get_mic_device_domain(hass: HomeAssistant, entity_id: str) -> str | None:
 
 def get_mic_device_id_from_entity_id(hass: HomeAssistant, entity_id: str) -> str | None:
     """Get the mic device id of an entity by id."""
+    if index := RelationshipIndex.get(hass):
+        return index.get_mic_device_id(entity_id)
+
     entity_registry = er.async_get(hass)
     if va_entity := entity_registry.async_get(entity_id):
         va_entry = hass.config_entries.async_get_entry(va_entity.config_entry_id)
@@ -192,6 +199,8 @@ def get_mic_device_id_from_entity_id(hass: HomeAssistant, entity_id: str) -> str
 
 def get_device_id_from_name(hass: HomeAssistant, device_name: str) -> str:
     """Get the device id of the device with the given name."""
+    if index := RelationshipIndex.get(hass):
+        return index.get_device_id_for_name(device_name)
 
     def find_device_for_domain(domain: str, device_name: str) -> str | None:
         entries = list(
@@ -225,6 +234,9 @@ def get_sensor_entity_from_instance(
     entry_id: str,
 ) -> str:
     """Get VA sensor entity from config entry."""
+    if index := RelationshipIndex.get(hass):
+        return index.get_sensor_for_entry(entry_id)
+
     entity_registry = er.async_get(hass)
     if integration_entities := er.async_entries_for_config_entry(
         entity_registry, entry_id
@@ -239,6 +251,9 @@ def get_entity_id_from_conversation_device_id(
     hass: HomeAssistant, device_id: str
 ) -> str | None:
     """Get the view assist entity id for a device id relating to the mic entity."""
+    if index := RelationshipIndex.get(hass):
+        return index.get_sensor_for_mic_device(device_id)
+
     for entry in get_integration_entries(hass):
         mic_entity_id = entry.runtime_data.core.mic_device
         entity_registry = er.async_get(hass)
@@ -282,6 +297,9 @@ def get_entity_id_by_browser_id(hass: HomeAssistant, browser_id: str) -> str:
         device_id = get_device_id_from_name(hass, browser_id)
 
     # Get all instances of view assist for browser id
+    if device_id and (index := RelationshipIndex.get(hass)):
+        return index.get_sensor_for_display_device(device_id)
+
     if device_id:
         entry_ids = [
             entry.entry_id
@@ -451,32 +469,3 @@ def json_to_dictdiffer(jsondiff: dict) -> list:
                 )
 
     return output
-
-
-def get_available_overlays(hass: HomeAssistant) -> dict[str, str]:
-    """Get available overlays for pipeline listening, processing, etc."""
-    # Read the HTML file
-    overlays = {}
-    paths = [hass.config.path(DOMAIN, DASHBOARD_DIR, f"{OVERLAY_FILE_NAME}.html")]
-    custom_path = hass.config.path(
-        DOMAIN, "custom_overlays", f"{OVERLAY_FILE_NAME}.html"
-    )
-    if Path(custom_path).exists():
-        paths.append(custom_path)
-
-    for path in paths:
-        if Path(path).exists():
-            content = Path(path).read_text(encoding="utf-8")
-
-            # Parse the HTML content
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Print the href attribute of each link
-            for div in soup.find_all("div", recursive=False):
-                o_id = div.get("id")
-                name = div.get("data-name")
-                if o_id and name:
-                    overlays[o_id] = name
-    if overlays:
-        return overlays
-    return {}
@@ -280,6 +280,7 @@ class VAData {
     this.server_time_delta = 0;
     this.browser_id = '';
     this.registered = false;
+    this.config_revision = null;
   }
 }
 
@@ -326,7 +327,6 @@ class ViewAssistHelpers {
 class ViewAssist {
   constructor() {
     this._hass = null;
-    this.serverTimeHandler = null;
     this.hide_header_timeout = null;
     this.hide_sidebar_timeout = null;
     this.variables = new VAData();
@@ -505,7 +505,6 @@ class ViewAssist {
             this.connect()
           } else {
             this.connected = false;
-            clearInterval(this.serverTimeHandler)
           }
         });
 
@@ -550,13 +549,12 @@ class ViewAssist {
       conn.subscribeMessage((msg) => this.incoming_message(msg), {
         type: "view_assist/connect",
         browser_id: this.variables.browser_id,
+        delta: true,
+        flow_control: true,
       })
 
-      // Test connection - this will fail if integration not yet loaded and cause a retry
-      const delta = await this._hass.callWS({
-        type: 'view_assist/get_server_time_delta',
-        epoch: new Date().getTime()
-      })
+      // Sync time with server - this will fail if integration not yet loaded and cause a retry
+      await this.sync_time();
       this.connected = true;
     } catch {
       this.connected = false;
@@ -566,15 +564,6 @@ class ViewAssist {
         console.log("View Assist - Unable to connect to server")
       }
     }
-
-    if (this.connected) {
-      // Create time sync job with server - updates every 5 minutes
-      await this.set_time_delta();
-      var t = this;
-      this.serverTimeHandler = setInterval(function () {
-        t.set_time_delta();
-      }, 300 * 1000);
-    }
   }
 
   async incoming_message(msg) {
@@ -585,50 +574,64 @@ class ViewAssist {
 
     //console.log("Event: " + event + ", Payload: " + JSON.stringify(payload));
 
-    switch (event) {
-      case "registered":
-        localStorage.setItem("view_assist_status", "registered");
-        this.variables.registered = true
-        // Add listening overlay html from overlay.html and overlay.css files
-        await this.inject_assist_listening_overlay();
-        // Setup device config
-        this.process_config(event, payload);
-        break;
-      case "reload":
-        clearInterval(this.serverTimeHandler);
-        this.connected = false;
-        setTimeout(() => this.connect(), 1000);
-        break;
-      case "unregistered":
-        localStorage.removeItem("view_assist_sensor");
-        localStorage.removeItem("view_assist_mimic_device");
-        localStorage.setItem("view_assist_status", "unregistered");
-        this.variables.config = {};
-        this.variables.registered = false;
-        await this.hide_sections(this.variables.registered);
-        setTimeout(() => this. display_browser_id(), 2000);
-        break;
-      case "config_update":
-        this.process_config(event, payload);
-        break;
-      case "timer_update":
-        this.variables.config.timers = payload
-        break;
-      case "navigate":
-        if (!is_mimic) {
-          if (payload["variables"]) {
-            this.variables.navigation = payload["variables"];
+    // Ack even if handling fails so the server does not stall sending
+    try {
+      switch (event) {
+        case "registered":
+          localStorage.setItem("view_assist_status", "registered");
+          this.variables.registered = true
+          // Add listening overlay html from overlay.html and overlay.css files
+          await this.inject_assist_listening_overlay();
+          // Setup device config
+          this.process_config(event, payload);
+          this.variables.config_revision = msg["revision"] ?? null;
+          break;
+        case "reload":
+          this.connected = false;
+          setTimeout(() => this.connect(), 1000);
+          break;
+        case "unregistered":
+          localStorage.removeItem("view_assist_sensor");
+          localStorage.removeItem("view_assist_mimic_device");
+          localStorage.setItem("view_assist_status", "unregistered");
+          this.variables.config = {};
+          this.variables.config_revision = null;
+          this.variables.registered = false;
+          await this.hide_sections(this.variables.registered);
+          setTimeout(() => this. display_browser_id(), 2000);
+          break;
+        case "config_update":
+          this.process_config(event, payload);
+          this.variables.config_revision = msg["revision"] ?? null;
+          break;
+        case "config_patch":
+          this.apply_config_patch(payload);
+          break;
+        case "time_sync":
+          // Server clock changed
+          this.sync_time().catch(() => {});
+          break;
+        case "timer_update":
+          this.variables.config.timers = payload
+          break;
+        case "navigate":
+          if (!is_mimic) {
+            if (payload["variables"]) {
+              this.variables.navigation = payload["variables"];
+            }
+            this.browser_navigate(payload["path"]);
           }
-          this.browser_navigate(payload["path"]);
-        }
-        break;
-      case "listening":
-        if (!is_mimic) {
-          this.show_assist_listening_overlay(payload["state"], payload["style"])
-        }
-        break;
-      default:
-        console.log("ViewAssist - unknown event: " + event);
+          break;
+        case "listening":
+          if (!is_mimic) {
+            this.show_assist_listening_overlay(payload["state"], payload["style"])
+          }
+          break;
+        default:
+          console.log("ViewAssist - unknown event: " + event);
+      }
+    } finally {
+      if (msg["seq"] != null) this.ack(msg["seq"]);
     }
   }
 
@@ -658,15 +661,101 @@ class ViewAssist {
     }
   }
 
-  async set_time_delta() {
-    // Get this clients time delta to the server
-    if (this.connected) {
-      const delta = await this._hass.callWS({
-        type: 'view_assist/get_server_time_delta',
-        epoch: new Date().getTime()
+  apply_config_patch(payload) {
+    // Apply config patch if it is from the current config revision, otherwise
+    // ask the server for the full config
+    if (payload.base !== this.variables.config_revision) {
+      this.request_resync();
+      return;
+    }
+    try {
+      const config = ViewAssist.apply_json_patch(
+        structuredClone(this.variables.config), payload.patch
+      );
+      this.process_config("config_update", config);
+      this.variables.config_revision = payload.revision;
+    } catch (e) {
+      console.log("ViewAssist - unable to apply config patch: ", e);
+      this.request_resync();
+    }
+  }
+
+  static apply_json_patch(doc, ops) {
+    // Apply RFC 6902 add, remove and replace operations
+    for (const op of ops) {
+      if (op.path === "") {
+        doc = op.value;
+        continue;
+      }
+      const keys = op.path.substring(1).split("/").map(
+        (k) => k.replace(/~1/g, "/").replace(/~0/g, "~")
+      );
+      const key = keys.pop();
+      let parent = doc;
+      for (const k of keys) {
+        if (parent[k] === undefined) throw new Error("Invalid patch path " + op.path);
+        parent = parent[k];
+      }
+      switch (op.op) {
+        case "add":
+        case "replace":
+          parent[key] = op.value;
+          break;
+        case "remove":
+          delete parent[key];
+          break;
+        default:
+          throw new Error("Unsupported patch op " + op.op);
+      }
+    }
+    return doc;
+  }
+
+  ack(seq) {
+    // Ack processed events to server, batching acks for events received together
+    this.ack_seq = seq;
+    if (this.ack_pending) return;
+    this.ack_pending = true;
+    setTimeout(() => {
+      this.ack_pending = false;
+      this._hass.callWS({
+        type: 'view_assist/ack',
+        browser_id: this.variables.browser_id,
+        seq: this.ack_seq,
+      }).catch(() => {});
+    }, 0);
+  }
+
+  async request_resync() {
+    // Ask server to resend full config
+    this.variables.config_revision = null;
+    try {
+      await this._hass.callWS({
+        type: 'view_assist/resync',
+        browser_id: this.variables.browser_id,
       })
-      this.variables.server_time_delta = delta;
+    } catch (e) {
+      console.log("ViewAssist - unable to resync config: ", e);
+    }
+  }
+
+  async sync_time(samples = 5) {
+    // Get this clients time delta to the server from the sample with the
+    // lowest round trip time, excluding server processing time
+    let best = null;
+    for (let i = 0; i < samples; i++) {
+      const t0 = Date.now();
+      const result = await this._hass.callWS({
+        type: 'view_assist/time_sync',
+        t0: t0,
+      });
+      const t3 = Date.now();
+      const rtt = (t3 - t0) - (result.t2 - result.t1);
+      if (!best || rtt < best.rtt) {
+        best = { rtt: rtt, offset: ((result.t1 - t0) + (result.t2 - t3)) / 2 };
+      }
     }
+    this.variables.server_time_delta = best.offset;
   }
 
   browser_navigate(path) {
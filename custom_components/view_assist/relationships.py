@@ -0,0 +1,277 @@
+"""Relationship index for View Assist devices.
+
+Maps mic devices, display browsers and config entries to VA sensors so helper
+lookups do not walk the entity and device registries on every call.  The index
+is marked stale by registry and config entry changes that affect it and is
+rebuilt on the next lookup.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.const import CONF_TYPE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    BROWSERMOD_DOMAIN,
+    CONF_DISPLAY_DEVICE,
+    CONF_MIC_DEVICE,
+    DOMAIN,
+    REMOTE_ASSIST_DISPLAY_DOMAIN,
+)
+from .typed import DISPLAY_DEVICE_TYPES, VAConfigEntry, VAType
+
+_LOGGER = logging.getLogger(__name__)
+
+DISPLAY_DEVICE_DOMAINS = [BROWSERMOD_DOMAIN, REMOTE_ASSIST_DISPLAY_DOMAIN]
+
+
+@dataclass
+class Relationships:
+    """Class to hold indexed relationships."""
+
+    # VA config entry id -> VA sensor entity id
+    entry_sensor: dict[str, str] = field(default_factory=dict)
+    # VA entity id -> VA config entry id
+    entity_entry: dict[str, str] = field(default_factory=dict)
+    # VA config entry id -> mic device id
+    entry_mic_device: dict[str, str] = field(default_factory=dict)
+    # VA config entry id -> mic entity integration domain
+    entry_mic_domain: dict[str, str] = field(default_factory=dict)
+    # Mic device id -> VA sensor entity id
+    mic_device_sensor: dict[str, str] = field(default_factory=dict)
+    # Display device id -> VA sensor entity id
+    display_device_sensor: dict[str, str] = field(default_factory=dict)
+    # Browser/display device name -> device id
+    browser_device: dict[str, str] = field(default_factory=dict)
+    # Configured entity id or its device id -> VA config entry id
+    config_value_entry: dict[str, str] = field(default_factory=dict)
+    # Entity ids of enabled VA devices in config entry order
+    device_entities: list[str] = field(default_factory=list)
+
+    # Ids that, if changed, affect the index
+    entity_ids: set[str] = field(default_factory=set)
+    device_ids: set[str] = field(default_factory=set)
+    entry_ids: set[str] = field(default_factory=set)
+
+
+class RelationshipIndex:
+    """Class to maintain an index of VA device relationships."""
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> RelationshipIndex | None:
+        """Get the relationship index."""
+        try:
+            return hass.data[DOMAIN][cls.__name__]
+        except KeyError:
+            return None
+
+    def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.config = config
+        self._relationships: Relationships | None = None
+
+    async def async_setup(self) -> bool:
+        """Set up registry and config entry listeners."""
+        self.config.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._entity_registry_updated
+            )
+        )
+        self.config.async_on_unload(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._device_registry_updated
+            )
+        )
+        self.config.async_on_unload(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._config_entry_changed
+            )
+        )
+        return True
+
+    async def async_unload(self) -> bool:
+        """Unload."""
+        self._relationships = None
+        return True
+
+    @property
+    def relationships(self) -> Relationships:
+        """Get relationships, rebuilding the index if stale."""
+        if self._relationships is None:
+            self._relationships = self._build()
+        return self._relationships
+
+    @callback
+    def invalidate(self) -> None:
+        """Mark the index as stale."""
+        self._relationships = None
+
+    @callback
+    def _entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Handle entity registry updates."""
+        if self._relationships is None:
+            return
+
+        entity_ids = {event.data["entity_id"], event.data.get("old_entity_id")}
+        if entity_ids & self._relationships.entity_ids:
+            self.invalidate()
+            return
+
+        if event.data["action"] == "create":
+            entity_registry = er.async_get(self.hass)
+            entity = entity_registry.async_get(event.data["entity_id"])
+            if entity and entity.platform == DOMAIN:
+                self.invalidate()
+
+    @callback
+    def _device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Handle device registry updates."""
+        if self._relationships is None:
+            return
+
+        if event.data["device_id"] in self._relationships.device_ids:
+            self.invalidate()
+            return
+
+        if event.data["action"] in ("create", "update"):
+            device_registry = dr.async_get(self.hass)
+            device = device_registry.async_get(event.data["device_id"])
+            if device and any(
+                entry.domain in DISPLAY_DEVICE_DOMAINS
+                for entry_id in device.config_entries
+                if (entry := self.hass.config_entries.async_get_entry(entry_id))
+            ):
+                self.invalidate()
+
+    @callback
+    def _config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Handle config entry changes."""
+        if self._relationships is None:
+            return
+
+        if (
+            entry.domain in (DOMAIN, *DISPLAY_DEVICE_DOMAINS)
+            or entry.entry_id in self._relationships.entry_ids
+        ):
+            self.invalidate()
+
+    def _build(self) -> Relationships:
+        """Build the relationship index from the registries."""
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
+        r = Relationships()
+
+        # Display devices by name
+        for domain in DISPLAY_DEVICE_DOMAINS:
+            for entry in self.hass.config_entries.async_entries(
+                domain, include_ignore=False, include_disabled=False
+            ):
+                for device in device_registry.devices.get_devices_for_config_entry_id(
+                    entry.entry_id
+                ):
+                    r.device_ids.add(device.id)
+                    if device.name:
+                        r.browser_device.setdefault(device.name, device.id)
+
+        accepted_types = [*DISPLAY_DEVICE_TYPES, VAType.AUDIO_ONLY]
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            entities = er.async_entries_for_config_entry(
+                entity_registry, entry.entry_id
+            )
+            for entity in entities:
+                r.entity_ids.add(entity.entity_id)
+                r.entity_entry[entity.entity_id] = entry.entry_id
+                if entity.domain == Platform.SENSOR:
+                    r.entry_sensor.setdefault(entry.entry_id, entity.entity_id)
+
+            if mic_entity_id := entry.data.get(CONF_MIC_DEVICE):
+                r.entity_ids.add(mic_entity_id)
+                if mic_entity := entity_registry.async_get(mic_entity_id):
+                    if mic_entity.device_id:
+                        r.device_ids.add(mic_entity.device_id)
+                        r.entry_mic_device[entry.entry_id] = mic_entity.device_id
+                    if mic_entity.config_entry_id and (
+                        mic_entry := self.hass.config_entries.async_get_entry(
+                            mic_entity.config_entry_id
+                        )
+                    ):
+                        r.entry_ids.add(mic_entry.entry_id)
+                        r.entry_mic_domain[entry.entry_id] = mic_entry.domain
+
+            # Device lookups only resolve to enabled VA devices
+            if entry.data.get(CONF_TYPE) not in accepted_types or entry.disabled_by:
+                continue
+
+            r.device_entities.extend(entity.entity_id for entity in entities)
+
+            # Reverse map of configured values, ie mic, media player, display
+            for value in entry.data.values():
+                if not value or not isinstance(value, str):
+                    continue
+                r.entity_ids.add(value)
+                r.config_value_entry.setdefault(value, entry.entry_id)
+                if (entity := entity_registry.async_get(value)) and entity.device_id:
+                    r.device_ids.add(entity.device_id)
+                    r.config_value_entry.setdefault(entity.device_id, entry.entry_id)
+
+            if not (sensor := r.entry_sensor.get(entry.entry_id)):
+                continue
+
+            if mic_device_id := r.entry_mic_device.get(entry.entry_id):
+                r.mic_device_sensor.setdefault(mic_device_id, sensor)
+            if display_device := entry.data.get(CONF_DISPLAY_DEVICE):
+                r.display_device_sensor.setdefault(display_device, sensor)
+
+        _LOGGER.debug("Built relationship index for %s devices", len(r.entry_sensor))
+        return r
+
+    def get_sensor_for_entry(self, entry_id: str) -> str | None:
+        """Get VA sensor entity id for a config entry."""
+        return self.relationships.entry_sensor.get(entry_id)
+
+    def get_sensor_for_mic_device(self, device_id: str) -> str | None:
+        """Get VA sensor entity id for a mic device id."""
+        return self.relationships.mic_device_sensor.get(device_id)
+
+    def get_sensor_for_display_device(self, device_id: str) -> str | None:
+        """Get VA sensor entity id for a display device id."""
+        return self.relationships.display_device_sensor.get(device_id)
+
+    def get_device_id_for_name(self, device_name: str) -> str | None:
+        """Get display device id from its name."""
+        return self.relationships.browser_device.get(device_name)
+
+    def get_entry_for_config_value(self, value: str) -> str | None:
+        """Get VA config entry id with a configured entity or device id."""
+        return self.relationships.config_value_entry.get(value)
+
+    def get_mic_device_id(self, entity_id: str) -> str | None:
+        """Get mic device id for a VA entity."""
+        r = self.relationships
+        if entry_id := r.entity_entry.get(entity_id):
+            return r.entry_mic_device.get(entry_id)
+        return None
+
+    def get_mic_device_domain(self, entity_id: str) -> str | None:
+        """Get mic integration domain for a VA entity."""
+        r = self.relationships
+        if entry_id := r.entity_entry.get(entity_id):
+            return r.entry_mic_domain.get(entry_id)
+        return None
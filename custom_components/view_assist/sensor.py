@@ -8,34 +8,83 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.components.sensor import RestoreSensor
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_platform
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.const import CONF_TYPE, EntityCategory, UnitOfInformation
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_platform, entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN, OPTION_KEY_MIGRATIONS
-from .core import TimerManager
+from .const import CONF_COMPACT_ATTRIBUTES, DOMAIN, OPTION_KEY_MIGRATIONS
+from .core import TimerManager, WebsocketManager
 from .devices import MenuManager, NavigationManager
-from .helpers import get_device_id_from_entity_id, get_mute_switch_entity_id
+from .helpers import (
+    get_device_id_from_entity_id,
+    get_master_config_entry,
+    get_mute_switch_entity_id,
+)
 from .typed import (
     DISPLAY_DEVICE_TYPES,
     VAConfigEntry,
     VAEvent,
     VAEventType,
     VATimeFormat,
+    VAType,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Time to collect changes into one state write
+WRITE_DEBOUNCE = 0.05
+
+# Bulky or fast changing attributes not recorded in compact attributes mode
+BULKY_ATTRIBUTES = frozenset(
+    {
+        "timers",
+        "last_updated",
+        "status_icons",
+        "menu_items",
+        "menu_config",
+        "active_overrides",
+        "intent_entities",
+        "message",
+        "alert_data",
+    }
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: VAConfigEntry, async_add_entities
 ):
     """Set up sensors from a config entry."""
 
-    sensors = [ViewAssistSensor(hass, config_entry)]
+    if config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG:
+        async_add_entities(
+            [
+                WebsocketStatsSensor(hass, config_entry, stat)
+                for stat in WebsocketStatsSensor.STATS
+            ]
+        )
+        return
+
+    # Read options as master runtime data may not be loaded yet
+    master_entry = get_master_config_entry(hass)
+    if master_entry.options.get(CONF_COMPACT_ATTRIBUTES, False):
+        sensors = [CompactViewAssistSensor(hass, config_entry)]
+    else:
+        sensors = [ViewAssistSensor(hass, config_entry)]
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         name="set_state",
@@ -49,6 +98,14 @@ async def async_setup_entry(
 class ViewAssistSensor(RestoreSensor):
     """Representation of a View Assist Sensor."""
 
+    # Events that change sensor attributes
+    WRITE_EVENTS = [
+        VAEventType.BACKGROUND_CHANGE,
+        VAEventType.TIMER_UPDATE,
+        VAEventType.BROWSER_REGISTERED,
+        VAEventType.CONFIG_UPDATE,
+    ]
+
     _attr_should_poll = False
 
     def __init__(
@@ -68,6 +125,9 @@ class ViewAssistSensor(RestoreSensor):
         self._attr_icon = "mdi:glasses"
         self._attribute_listeners: dict[str, Callable] = {}
         self._last_update: dt = dt.now()
+        # Core attributes only change with the config entry or registries
+        self._core_attributes: dict[str, Any] | None = None
+        self._cancel_write: CALLBACK_TYPE | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is about to be added to hass."""
@@ -144,10 +204,75 @@ class ViewAssistSensor(RestoreSensor):
             )
         )
 
+        self.async_on_remove(self._async_cancel_write)
+
+        # Invalidate cached core attributes on registry and config changes
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._entity_registry_updated
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._config_entry_changed
+            )
+        )
+
         # Add listener to timer changes
         # if timers := TimerManager.get(self.hass):
         #    timers.store.add_listener(self.entity_id, self._event_handler)
 
+    @callback
+    def async_schedule_write(self, immediate: bool = False) -> None:
+        """Schedule a state write, collecting changes in a short window.
+
+        Immediate writes also send any changes waiting to be written.
+        """
+        if immediate:
+            self._async_write()
+        elif self._cancel_write is None:
+            self._cancel_write = async_call_later(
+                self.hass, WRITE_DEBOUNCE, self._async_write
+            )
+
+    @callback
+    def _async_write(self, *args) -> None:
+        """Write state."""
+        self._async_cancel_write()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_write(self) -> None:
+        """Cancel a scheduled state write."""
+        if self._cancel_write:
+            self._cancel_write()
+            self._cancel_write = None
+
+    @callback
+    def _entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Invalidate core attributes if mic device entities change."""
+        if self._core_attributes is None:
+            return
+        if event.data["entity_id"] in (
+            self._core_attributes["mic_device"],
+            self._core_attributes["mute_switch"],
+        ) or (
+            (entity := er.async_get(self.hass).async_get(event.data["entity_id"]))
+            and entity.device_id
+            and entity.device_id == self._core_attributes["mic_device_id"]
+        ):
+            self._core_attributes = None
+
+    @callback
+    def _config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Invalidate core attributes if config entry changes."""
+        if entry.entry_id == self.config.entry_id:
+            self._core_attributes = None
+
     async def _event_handler(self, event: VAEvent):
         """Handle internal events."""
         if isinstance(event, VAEvent):
@@ -160,13 +285,11 @@ class ViewAssistSensor(RestoreSensor):
                 "Handling event %s received for %s", event.event_name, self.entity_id
             )
 
-            if event.event_name in [
-                VAEventType.BACKGROUND_CHANGE,
-                VAEventType.TIMER_UPDATE,
-                VAEventType.BROWSER_REGISTERED,
-                VAEventType.CONFIG_UPDATE,
-            ]:
-                self.schedule_update_ha_state(True)
+            if event.event_name in self.WRITE_EVENTS:
+                # Registered is already delayed for the browser to be ready
+                self.async_schedule_write(
+                    immediate=event.event_name == VAEventType.BROWSER_REGISTERED
+                )
 
     @callback
     def handle_set_entity_state(self, **kwargs):
@@ -199,7 +322,8 @@ class ViewAssistSensor(RestoreSensor):
                 update_ha = True
 
         if update_ha:
-            self.schedule_update_ha_state(True)
+            # Write state changes straight away for automations on the state
+            self.async_schedule_write(immediate="state" in kwargs)
 
     # TODO: Remove this when BPs/Views migrated
     def get_option_key_migration_value(self, value: str) -> str:
@@ -231,20 +355,27 @@ class ViewAssistSensor(RestoreSensor):
         return attrs
 
     def _get_core_attributes(self) -> dict[str, Any]:
+        """Get core attributes dictionary, building if not cached."""
+        if self._core_attributes is None:
+            self._core_attributes = self._build_core_attributes()
+        return self._core_attributes.copy()
+
+    def _build_core_attributes(self) -> dict[str, Any]:
         """Build core attributes dictionary."""
         d = self.config.runtime_data.core
+        mic_device_id = get_device_id_from_entity_id(self.hass, d.mic_device)
         return {
             "name": d.name,
             "type": d.type,
             "mic_device": d.mic_device,
-            "mic_device_id": get_device_id_from_entity_id(self.hass, d.mic_device),
+            "mic_device_id": mic_device_id,
             "mute_switch": get_mute_switch_entity_id(self.hass, d.mic_device),
             "display_device": d.display_device,
             "intent_device": d.intent_device,
             "orientation_sensor": d.orientation_sensor,
             "mediaplayer_device": d.mediaplayer_device,
             "musicplayer_device": d.musicplayer_device,
-            "voice_device_id": get_device_id_from_entity_id(self.hass, d.mic_device),
+            "voice_device_id": mic_device_id,
         }
 
     def _get_all_device_status_attributes(self) -> dict[str, Any]:
@@ -292,3 +423,93 @@ class ViewAssistSensor(RestoreSensor):
         if d.assist_prompt is not None and d.assist_prompt != "":
             attrs["assist_prompt"] = d.assist_prompt
         return attrs
+
+
+class CompactViewAssistSensor(ViewAssistSensor):
+    """View Assist sensor with compact attributes.
+
+    Timers are sent to browsers over the VA websocket and last updated is not
+    set, so they do not cause state writes.  Other bulky attributes are kept for
+    dashboards but not recorded.
+    """
+
+    WRITE_EVENTS = [
+        VAEventType.BACKGROUND_CHANGE,
+        VAEventType.BROWSER_REGISTERED,
+        VAEventType.CONFIG_UPDATE,
+    ]
+
+    _unrecorded_attributes = BULKY_ATTRIBUTES
+
+    def _get_all_device_status_attributes(self) -> dict[str, Any]:
+        """Build compact core status attributes dictionary."""
+        d = self.config.runtime_data.default
+        return {
+            "do_not_disturb": d.do_not_disturb,
+            "use_announce": d.use_announce,
+        }
+
+
+class WebsocketStatsSensor(SensorEntity):
+    """Optional diagnostic sensor for websocket channel stats.
+
+    Polled, so sending messages does not also write sensor states.
+    """
+
+    STATS = ["messages", "bytes", "connections"]
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+    _unrecorded_attributes = frozenset({"browsers", "entries"})
+
+    def __init__(self, hass: HomeAssistant, config: VAConfigEntry, stat: str) -> None:
+        """Initialise the sensor."""
+        self.hass = hass
+        self.config = config
+        self._stat = stat
+        self._attr_name = f"View Assist websocket {stat}"
+        self._attr_unique_id = f"{DOMAIN}_websocket_{stat}"
+        self._attr_icon = "mdi:lan-connect" if stat == "connections" else "mdi:lan"
+        if stat == "connections":
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        if stat == "bytes":
+            self._attr_device_class = SensorDeviceClass.DATA_SIZE
+            self._attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    async def async_update(self) -> None:
+        """Update stats."""
+        if not (websockets := WebsocketManager.get(self.hass)):
+            return
+        stats = websockets.get_stats()
+
+        if self._stat == "connections":
+            self._attr_native_value = stats["connections"]
+            self._attr_extra_state_attributes = {
+                "waiting_admission": stats["waiting_admission"],
+                "connects": sum(b["connects"] for b in stats["browsers"].values()),
+                "disconnects": sum(
+                    b["disconnects"] for b in stats["browsers"].values()
+                ),
+                "replaced": sum(b["replaced"] for b in stats["browsers"].values()),
+            }
+            return
+
+        by_event: dict[str, int] = {}
+        for browser in stats["browsers"].values():
+            for event, value in browser[f"{self._stat}_by_event"].items():
+                by_event[event] = by_event.get(event, 0) + value
+        self._attr_native_value = sum(by_event.values())
+        self._attr_extra_state_attributes = {
+            **by_event,
+            "browsers": {
+                browser_id: browser[self._stat]
+                for browser_id, browser in stats["browsers"].items()
+            },
+            "entries": {
+                entry_id: entry[self._stat]
+                for entry_id, entry in stats["entries"].items()
+            },
+        }
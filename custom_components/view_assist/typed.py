@@ -94,6 +94,7 @@ class IntegrationConfig:
 
     enable_updates: bool = True
     translation_engine: str | None = None
+    compact_attributes: bool = False
 
 
 @dataclass
@@ -222,6 +223,7 @@ class VAEventType(StrEnum):
     BROWSER_UNREGISTERED = "unregistered"
     TIMER_UPDATE = "timer_update"
     RELOAD = "reload"
+    TIME_SYNC = "time_sync"
 
 
 @dataclass
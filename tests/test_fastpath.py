@@ -0,0 +1,94 @@
+"""Fast path equivalence tests.
+
+The fast path must decode a sentence the same as the full translate and
+normalise pipeline, or fall through to it.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from custom_components.view_assist.core.translator import (  # noqa: E402
+    Normaliser,
+    TimeSentenceTranslator,
+)
+from custom_components.view_assist.core.translator.fastpath import (  # noqa: E402
+    FastPathRecognizer,
+)
+from custom_components.view_assist.core.translator.langpack import (  # noqa: E402
+    NORMALISER_PACK,
+    LanguagePacks,
+)
+
+SENTENCES = [
+    "5 minutes",
+    "1 hour and 30 minutes",
+    "1 hour 20 minutes",
+    "2 hours",
+    "10 hours",
+    "3 days",
+    "5 pm",
+    "5 30 pm",
+    "5:30 pm",
+    "5 oclock",
+    "5 oclock tomorrow",
+    "5 pm tomorrow",
+]
+
+LOCALE_SENTENCES = {
+    "en": ["twenty minutes", "five pm"],
+    "de": ["zwanzig minuten", "zehn stunden", "5 uhr", "5 uhr morgen"],
+    "es": ["diez minutos", "5 horas"],
+    "fr": ["vingt minutes", "dix heures", "5 heures", "5 heures 30"],
+    "ro": [],
+    "sr": [],
+    "ua": [],
+}
+
+
+@pytest.fixture
+async def packs_hass(hass, tmp_path):
+    """Hass with this integration's language packs in its config dir."""
+    (tmp_path / "custom_components").mkdir()
+    (tmp_path / "custom_components" / "view_assist").symlink_to(
+        Path(__file__).parents[1] / "custom_components" / "view_assist"
+    )
+    hass.config.config_dir = str(tmp_path)
+    yield hass
+    LanguagePacks.get(hass).clear()
+
+
+def _decoded(timer_info) -> dict | None:
+    """Get the decoded fields of a TimerInfo."""
+    if timer_info is None:
+        return None
+    d = asdict(timer_info)
+    d.pop("sentence")
+    return d
+
+
+@pytest.mark.parametrize("locale", LOCALE_SENTENCES)
+async def test_fast_path_matches_pipeline(packs_hass, locale) -> None:
+    """Test fast path results equal the full pipeline for each locale."""
+    translator = TimeSentenceTranslator(packs_hass, None)
+    normaliser = Normaliser(packs_hass, locale=locale)
+    assert await translator.async_load_language_pack(locale)
+    assert await normaliser.async_load_language_packs()
+
+    packs = LanguagePacks.get(packs_hass)
+    recognizer = FastPathRecognizer(
+        packs_hass,
+        packs.get_loaded(LanguagePacks.pack_name(locale)),
+        packs.get_loaded(NORMALISER_PACK),
+    )
+
+    for sentence in SENTENCES + LOCALE_SENTENCES[locale]:
+        if (result := recognizer.recognise(sentence)) is None:
+            continue
+        translated = await translator.translate(sentence, locale=locale)
+        assert _decoded(result[1]) == _decoded(
+            normaliser.normalise_sentence(translated)
+        ), f"{locale}: {sentence}"